@@ -10,6 +10,16 @@ Author: [Your Name]
 License: MIT
 """
 
+import functools
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+
+# Plaintext alphabet: position i of this string is the symbol encoded as i
+ALPHABET = "ABCDEFGHIJKLMNOPQRSTUVWXYZ "
+
+
 def pgcd(a, b):
     """
     Calculate the Greatest Common Divisor (GCD) using Euclidean algorithm.
@@ -47,14 +57,18 @@ def euclide_etendu(a, m):
         >>> euclide_etendu(5, 27)
         (1, 11, -2)  # Because 5*11 + 27*(-2) = 1
     """
-    if m == 0:
-        return a, 1, 0
+    # Iterative form: no recursion limit for large moduli.
+    # Invariants: x0*a0 + y0*m0 = a and x1*a0 + y1*m0 = m
+    x0, x1 = 1, 0
+    y0, y1 = 0, 1
     
-    gcd, x1, y1 = euclide_etendu(m, a % m)
-    x = y1
-    y = x1 - (a // m) * y1
+    while m != 0:
+        q = a // m
+        a, m = m, a - q * m
+        x0, x1 = x1, x0 - q * x1
+        y0, y1 = y1, y0 - q * y1
     
-    return gcd, x, y
+    return a, x0, y0
 
 
 def inverse_modulaire(a, m):
@@ -198,6 +212,559 @@ def dechiffrer_affine(message_chiffre, a, b):
     return resultat
 
 
+class CleAffine:
+    """
+    Compiled Affine key (a, b) applying the cipher through translation tables.
+
+    The forward and inverse permutations of the 27-symbol alphabet are computed
+    once when the key is built. Messages are then processed by `str.translate`
+    or `bytes.translate`, so the cost per character stays in C instead of the
+    Python loop used by `chiffrer_affine` / `dechiffrer_affine`.
+
+    The behaviour matches those functions: text is converted to uppercase and
+    characters outside {A-Z, space} are kept unchanged. For `bytes` input only
+    ASCII letters are case-folded (as `bytes.upper` would do).
+
+    Args:
+        a (int): Multiplicative key (must be coprime with 27)
+        b (int): Additive key
+
+    Raises:
+        ValueError: If 'a' is not invertible modulo 27
+
+    Example:
+        >>> cle = CleAffine(5, 8)
+        >>> cle.dechiffrer(cle.chiffrer("HELLO WORLD"))
+        'HELLO WORLD'
+    """
+
+    def __init__(self, a, b):
+        a_inv = inverse_modulaire(a, 27)
+        if a_inv is None:
+            raise ValueError(f"a = {a} n'est pas inversible modulo 27")
+
+        self.a = a
+        self.b = b
+        self.a_inv = a_inv
+
+        # Image of each alphabet position under the key and under its inverse
+        chiffre = "".join(ALPHABET[(a * M + b) % 27] for M in range(27))
+        clair = "".join(ALPHABET[(a_inv * (C - b)) % 27] for C in range(27))
+
+        self._table_chiffrement = str.maketrans(ALPHABET, chiffre)
+        self._table_dechiffrement = str.maketrans(ALPHABET, clair)
+        self._octets_chiffrement = self._table_octets(chiffre)
+        self._octets_dechiffrement = self._table_octets(clair)
+
+    @staticmethod
+    def _table_octets(image):
+        """
+        Build a 256-byte table for `bytes.translate` mapping the alphabet
+        (lowercase letters included) to 'image' and every other byte to itself.
+        """
+        table = bytearray(range(256))
+        for position, symbole in enumerate(ALPHABET):
+            table[ord(symbole)] = ord(image[position])
+            if symbole != ' ':
+                table[ord(symbole.lower())] = ord(image[position])
+        return bytes(table)
+
+    def chiffrer(self, message):
+        """
+        Encrypt a message with this key.
+
+        Args:
+            message (str or bytes): The plaintext message
+
+        Returns:
+            str or bytes: Encrypted message, of the same type as the input
+        """
+        if isinstance(message, (bytes, bytearray, memoryview)):
+            return bytes(message).translate(self._octets_chiffrement)
+        return message.upper().translate(self._table_chiffrement)
+
+    def dechiffrer(self, message_chiffre):
+        """
+        Decrypt a message with this key.
+
+        Args:
+            message_chiffre (str or bytes): The encrypted message
+
+        Returns:
+            str or bytes: Decrypted message, of the same type as the input
+        """
+        if isinstance(message_chiffre, (bytes, bytearray, memoryview)):
+            return bytes(message_chiffre).translate(self._octets_dechiffrement)
+        return message_chiffre.upper().translate(self._table_dechiffrement)
+
+
+def lire_par_morceaux(fichier, taille_tampon=1 << 20):
+    """
+    Read an open file chunk by chunk.
+
+    Args:
+        fichier: File object opened in text or binary mode
+        taille_tampon (int): Maximum size of each chunk (characters or bytes)
+
+    Yields:
+        str or bytes: Successive chunks until the end of the file
+    """
+    while True:
+        morceau = fichier.read(taille_tampon)
+        if not morceau:
+            return
+        yield morceau
+
+
+def chiffrer_flux(morceaux, a, b):
+    """
+    Encrypt an iterable of chunks incrementally.
+
+    Each symbol is encrypted independently, so the chunk boundaries do not
+    change the result: joining the output gives exactly
+    chiffrer_affine("".join(morceaux), a, b). Only one chunk is held in
+    memory at a time.
+
+    Args:
+        morceaux (iterable): Chunks of plaintext (str or bytes)
+        a (int): Multiplicative key (must be coprime with 27)
+        b (int): Additive key
+
+    Returns:
+        iterator: Encrypted chunks (str or bytes), in order
+
+    Raises:
+        ValueError: If 'a' is not invertible modulo 27
+    """
+    cle = CleAffine(a, b)
+    return map(cle.chiffrer, morceaux)
+
+
+def dechiffrer_flux(morceaux, a, b):
+    """
+    Decrypt an iterable of chunks incrementally.
+
+    Args:
+        morceaux (iterable): Chunks of ciphertext (str or bytes)
+        a (int): Multiplicative key (must be coprime with 27)
+        b (int): Additive key
+
+    Returns:
+        iterator: Decrypted chunks (str or bytes), in order
+
+    Raises:
+        ValueError: If 'a' is not invertible modulo 27
+    """
+    cle = CleAffine(a, b)
+    return map(cle.dechiffrer, morceaux)
+
+
+def _traiter_fichier(fichier_entree, fichier_sortie, flux, a, b,
+                     taille_tampon, encoding):
+    """
+    Apply 'flux' (chiffrer_flux or dechiffrer_flux) from one file to another.
+
+    With encoding=None both files are handled in binary mode and only ASCII
+    letters are case-folded; otherwise they are read as text so that every
+    character is uppercased like in chiffrer_affine.
+    """
+    if encoding is None:
+        entree = open(fichier_entree, "rb")
+        sortie = open(fichier_sortie, "wb")
+    else:
+        entree = open(fichier_entree, "r", encoding=encoding, newline="")
+        sortie = open(fichier_sortie, "w", encoding=encoding, newline="")
+
+    with entree, sortie:
+        for morceau in flux(lire_par_morceaux(entree, taille_tampon), a, b):
+            sortie.write(morceau)
+
+
+def chiffrer_fichier_affine(fichier_entree, fichier_sortie, a, b,
+                            taille_tampon=1 << 20, encoding="utf-8"):
+    """
+    Encrypt a file into another one with a bounded memory footprint.
+
+    Args:
+        fichier_entree (str): Path of the plaintext file
+        fichier_sortie (str): Path of the encrypted file to write
+        a (int): Multiplicative key (must be coprime with 27)
+        b (int): Additive key
+        taille_tampon (int): Size of each chunk read from the input
+        encoding (str or None): Text encoding, or None for binary mode
+
+    Raises:
+        ValueError: If 'a' is not invertible modulo 27
+    """
+    _traiter_fichier(fichier_entree, fichier_sortie, chiffrer_flux, a, b,
+                     taille_tampon, encoding)
+
+
+def dechiffrer_fichier_affine(fichier_entree, fichier_sortie, a, b,
+                              taille_tampon=1 << 20, encoding="utf-8"):
+    """
+    Decrypt a file into another one with a bounded memory footprint.
+
+    Args:
+        fichier_entree (str): Path of the encrypted file
+        fichier_sortie (str): Path of the decrypted file to write
+        a (int): Multiplicative key (must be coprime with 27)
+        b (int): Additive key
+        taille_tampon (int): Size of each chunk read from the input
+        encoding (str or None): Text encoding, or None for binary mode
+
+    Raises:
+        ValueError: If 'a' is not invertible modulo 27
+    """
+    _traiter_fichier(fichier_entree, fichier_sortie, dechiffrer_flux, a, b,
+                     taille_tampon, encoding)
+
+
+@functools.lru_cache(maxsize=32)
+def table_inverses(m):
+    """
+    Table of the modular inverses of every residue modulo m.
+
+    The table is computed once per modulus and then served from the cache.
+
+    Args:
+        m (int): The modulus
+
+    Returns:
+        tuple: Element x is the inverse of x modulo m, or None if it has none
+
+    Example:
+        >>> table_inverses(27)[5]
+        11
+    """
+    return tuple(inverse_modulaire(x, m) for x in range(m))
+
+
+class AffineCipher:
+    """
+    Affine cipher over an arbitrary alphabet.
+
+    Each symbol at position M of the alphabet is encrypted as the symbol at
+    position (a*M + b) mod m, where m is the size of the alphabet. Characters
+    outside the alphabet are kept unchanged, and no case conversion is done.
+
+    The inverse table of the modulus is shared between all the instances with
+    the same alphabet size, and the translation maps of the most recently used
+    keys are kept in an LRU cache, so repeated calls only run `translate`.
+
+    Args:
+        alphabet (str, bytes or range): The ordered symbols of the alphabet;
+            a `range` is read as Unicode code points (e.g. range(256) for
+            all byte values, range(0x0400, 0x0500) for Cyrillic)
+        taille_cache (int): Number of keys whose translation maps are cached
+
+    Raises:
+        ValueError: If the alphabet is empty or contains duplicate symbols
+
+    Example:
+        >>> chiffre = AffineCipher("ABCDEFGHIJKLMNOPQRSTUVWXYZÀÂÇÉÈÊËÎÏÔÙÛÜ ")
+        >>> chiffre.chiffrer("ÉTÉ À PARIS", 7, 3)
+        'GQGÙZÙÇDCTJ'
+    """
+
+    def __init__(self, alphabet, taille_cache=128):
+        if isinstance(alphabet, str):
+            symboles = tuple(map(ord, alphabet))
+        else:
+            symboles = tuple(alphabet)
+
+        if not symboles:
+            raise ValueError("L'alphabet ne peut pas être vide")
+        if len(set(symboles)) != len(symboles):
+            raise ValueError("L'alphabet contient des symboles en double")
+
+        self.symboles = symboles
+        self.m = len(symboles)
+        self.inverses = table_inverses(self.m)
+        # bytes.translate only applies when every symbol fits in a byte
+        self.binaire = max(symboles) < 256
+        self._tables = functools.lru_cache(maxsize=taille_cache)(self._construire_tables)
+
+    def inverse(self, a):
+        """
+        Return the inverse of 'a' modulo the size of the alphabet.
+
+        Args:
+            a (int): Multiplicative key
+
+        Returns:
+            int or None: The modular inverse if it exists, None otherwise
+        """
+        return self.inverses[a % self.m]
+
+    def _construire_tables(self, a, b):
+        """
+        Build the (encryption, decryption) maps of the key (a, b), as
+        `str.translate` dicts and, for byte alphabets, `bytes.translate` tables.
+        """
+        a_inv = self.inverses[a]
+        if a_inv is None:
+            raise ValueError(f"a = {a} n'est pas inversible modulo {self.m}")
+
+        m = self.m
+        symboles = self.symboles
+        chiffre = {symboles[M]: symboles[(a * M + b) % m] for M in range(m)}
+        clair = {symboles[C]: symboles[(a_inv * (C - b)) % m] for C in range(m)}
+
+        if not self.binaire:
+            return chiffre, clair, None, None
+
+        octets_chiffre = bytearray(range(256))
+        octets_clair = bytearray(range(256))
+        for source, image in chiffre.items():
+            octets_chiffre[source] = image
+        for source, image in clair.items():
+            octets_clair[source] = image
+        return chiffre, clair, bytes(octets_chiffre), bytes(octets_clair)
+
+    def _appliquer(self, message, a, b, dechiffrement):
+        """
+        Translate 'message' with the cached maps of (a, b).
+        """
+        tables = self._tables(a % self.m, b % self.m)
+        if isinstance(message, (bytes, bytearray, memoryview)):
+            if not self.binaire:
+                raise TypeError("Les octets ne sont acceptés que pour un alphabet d'octets")
+            return bytes(message).translate(tables[3 if dechiffrement else 2])
+        return message.translate(tables[1 if dechiffrement else 0])
+
+    def chiffrer(self, message, a, b):
+        """
+        Encrypt a message: C = (a * M + b) mod m.
+
+        Args:
+            message (str or bytes): The plaintext message
+            a (int): Multiplicative key (must be coprime with m)
+            b (int): Additive key
+
+        Returns:
+            str or bytes: Encrypted message, of the same type as the input
+
+        Raises:
+            ValueError: If 'a' is not invertible modulo m
+        """
+        return self._appliquer(message, a, b, False)
+
+    def dechiffrer(self, message_chiffre, a, b):
+        """
+        Decrypt a message: M = a^(-1) * (C - b) mod m.
+
+        Args:
+            message_chiffre (str or bytes): The encrypted message
+            a (int): Multiplicative key (must be coprime with m)
+            b (int): Additive key
+
+        Returns:
+            str or bytes: Decrypted message, of the same type as the input
+
+        Raises:
+            ValueError: If 'a' is not invertible modulo m
+        """
+        return self._appliquer(message_chiffre, a, b, True)
+
+
+@functools.lru_cache(maxsize=1024)
+def _cle_compilee(a, b):
+    """
+    Return the CleAffine of (a, b), built once per process and per key.
+    """
+    return CleAffine(a, b)
+
+
+def _traiter_morceau(dechiffrement, morceau):
+    """
+    Worker: process a list of (message, a, b) records.
+    """
+    if dechiffrement:
+        return [_cle_compilee(a, b).dechiffrer(message) for message, a, b in morceau]
+    return [_cle_compilee(a, b).chiffrer(message) for message, a, b in morceau]
+
+
+def _traiter_morceau_cle(dechiffrement, a, b, morceau):
+    """
+    Worker: process a list of messages sharing the key (a, b).
+    """
+    cle = _cle_compilee(a, b)
+    fonction = cle.dechiffrer if dechiffrement else cle.chiffrer
+    return [fonction(message) for message in morceau]
+
+
+def _decouper(enregistrements, taille_morceau):
+    """
+    Split an iterable into lists of at most 'taille_morceau' elements.
+    """
+    morceau = []
+    for enregistrement in enregistrements:
+        morceau.append(enregistrement)
+        if len(morceau) == taille_morceau:
+            yield morceau
+            morceau = []
+    if morceau:
+        yield morceau
+
+
+def _valider_cles(enregistrements):
+    """
+    Yield the (message, a, b) records, checking each distinct key only once.
+    """
+    cles_vues = set()
+    for message, a, b in enregistrements:
+        if (a, b) not in cles_vues:
+            _cle_compilee(a, b)  # Raises ValueError for an invalid 'a'
+            cles_vues.add((a, b))
+        yield message, a, b
+
+
+def _traiter_lot(enregistrements, a, b, processus, taille_morceau, dechiffrement):
+    """
+    Shared implementation of chiffrer_lot and dechiffrer_lot.
+    """
+    if a is None:
+        fonction = functools.partial(_traiter_morceau, dechiffrement)
+        morceaux = _decouper(_valider_cles(enregistrements), taille_morceau)
+    else:
+        _cle_compilee(a, b)  # Raises ValueError for an invalid 'a'
+        fonction = functools.partial(_traiter_morceau_cle, dechiffrement, a, b)
+        morceaux = _decouper(enregistrements, taille_morceau)
+
+    morceaux = list(morceaux)
+
+    if processus == 1 or len(morceaux) <= 1:
+        resultats = map(fonction, morceaux)
+        return [texte for morceau in resultats for texte in morceau]
+
+    with ProcessPoolExecutor(max_workers=processus) as executeur:
+        resultats = executeur.map(fonction, morceaux)
+        return [texte for morceau in resultats for texte in morceau]
+
+
+def chiffrer_lot(enregistrements, a=None, b=None, processus=None, taille_morceau=10_000):
+    """
+    Encrypt a large batch of messages, in parallel over several processes.
+
+    Records are either (message, a, b) tuples, or plain messages when a shared
+    key is given with 'a' and 'b'. Each distinct key is validated and compiled
+    once, the records are sent to the worker processes in chunks of
+    'taille_morceau', and the results come back in the input order.
+
+    Args:
+        enregistrements (iterable): (message, a, b) tuples, or messages if
+            'a' and 'b' are given
+        a (int or None): Shared multiplicative key
+        b (int or None): Shared additive key
+        processus (int or None): Number of worker processes (None: one per
+            CPU, 1: no pool, everything runs in the calling process)
+        taille_morceau (int): Number of records sent to a worker at once
+
+    Returns:
+        list: Encrypted messages, in the same order as the records
+
+    Raises:
+        ValueError: If one of the keys has an 'a' not invertible modulo 27
+
+    Example:
+        >>> chiffrer_lot(["HELLO", "WORLD"], 5, 8)
+        ['QBJJY', 'KYMJX']
+    """
+    return _traiter_lot(enregistrements, a, b, processus, taille_morceau, False)
+
+
+def dechiffrer_lot(enregistrements, a=None, b=None, processus=None, taille_morceau=10_000):
+    """
+    Decrypt a large batch of messages, in parallel over several processes.
+
+    Args:
+        enregistrements (iterable): (message_chiffre, a, b) tuples, or
+            encrypted messages if 'a' and 'b' are given
+        a (int or None): Shared multiplicative key
+        b (int or None): Shared additive key
+        processus (int or None): Number of worker processes (None: one per
+            CPU, 1: no pool, everything runs in the calling process)
+        taille_morceau (int): Number of records sent to a worker at once
+
+    Returns:
+        list: Decrypted messages, in the same order as the records
+
+    Raises:
+        ValueError: If one of the keys has an 'a' not invertible modulo 27
+    """
+    return _traiter_lot(enregistrements, a, b, processus, taille_morceau, True)
+
+
+def benchmark_lot(nb_messages=1_000_000, longueur=12, processus=None):
+    """
+    Compare the per-record latency of `chiffrer_affine` and `chiffrer_lot`.
+
+    Args:
+        nb_messages (int): Number of short messages to encrypt
+        longueur (int): Length of each message, in characters
+        processus (int or None): Number of worker processes for the pool
+    """
+    messages = ["".join(random.choices(ALPHABET, k=longueur)) for _ in range(nb_messages)]
+    cles = [(a, b) for a in range(1, 27) if pgcd(a, 27) == 1 for b in range(27)]
+    enregistrements = [(message, *random.choice(cles)) for message in messages]
+
+    def mesurer(nom, fonction):
+        debut = time.perf_counter()
+        fonction()
+        duree = time.perf_counter() - debut
+        print(f"{nom:<32}: {duree / nb_messages * 1e6:8.3f} µs/message")
+
+    print(f"{nb_messages} messages de {longueur} caractères")
+    mesurer("chiffrer_affine (boucle)",
+            lambda: [chiffrer_affine(m, a, b) for m, a, b in enregistrements])
+    mesurer("chiffrer_lot (1 processus)",
+            lambda: chiffrer_lot(enregistrements, processus=1))
+    mesurer("chiffrer_lot (pool)",
+            lambda: chiffrer_lot(enregistrements, processus=processus))
+    mesurer("chiffrer_lot clé commune (pool)",
+            lambda: chiffrer_lot(messages, 5, 8, processus=processus))
+
+
+def benchmark_affine(tailles=(1_000, 1_000_000, 100_000_000), a=5, b=8,
+                     taille_max_boucle=1_000_000):
+    """
+    Compare the throughput of `chiffrer_affine` with `CleAffine`.
+
+    The character loop is only measured up to 'taille_max_boucle' characters,
+    beyond that it would take minutes and is reported as skipped.
+
+    Args:
+        tailles (tuple): Message sizes to measure, in characters
+        a (int): Multiplicative key
+        b (int): Additive key
+        taille_max_boucle (int): Largest size measured with the character loop
+    """
+    motif = "LE CHIFFREMENT AFFINE, 2024! "
+    cle = CleAffine(a, b)
+
+    def debit(fonction, donnees):
+        debut = time.perf_counter()
+        fonction(donnees)
+        duree = time.perf_counter() - debut
+        return len(donnees) / duree / 1e6 if duree > 0 else float("inf")
+
+    print(f"{'Taille':>12} | {'boucle (Mo/s)':>14} | {'str (Mo/s)':>12} | {'bytes (Mo/s)':>12}")
+    print("-" * 60)
+    for taille in tailles:
+        message = (motif * (taille // len(motif) + 1))[:taille]
+        octets = message.encode("ascii")
+
+        if taille <= taille_max_boucle:
+            boucle = f"{debit(lambda m: chiffrer_affine(m, a, b), message):14.2f}"
+        else:
+            boucle = f"{'ignoré':>14}"
+
+        texte = debit(cle.chiffrer, message)
+        binaire = debit(cle.chiffrer, octets)
+        print(f"{taille:>12} | {boucle} | {texte:12.2f} | {binaire:12.2f}")
+
+
 def main():
     """
     Main function providing an interactive menu for encryption and decryption.
@@ -0,0 +1,209 @@
+"""
+Affine Cipher Cryptanalysis
+===========================
+Exhaustive key search on the Affine cipher (A-Z + space, modulo 27).
+
+The modulus is fixed at 27, so there are only 18 valid values of 'a'
+(those with PGCD(a, 27) = 1) times 27 values of 'b', i.e. 486 keys.
+Every key is ranked with a chi-squared score against French letter
+frequencies, and only the best candidates are actually decrypted.
+
+Scoring does not decrypt the message 486 times: the Affine cipher is a
+permutation of the alphabet, so the symbol counts of the plaintext under a
+key are the symbol counts of the ciphertext read in a different order.
+The ciphertext is counted once, and each key costs 27 multiplications.
+
+Author: [Your Name]
+License: MIT
+"""
+
+import random
+import time
+
+from affine_cipher import ALPHABET, CleAffine, chiffrer_affine, pgcd
+
+
+# Frequencies of the letters in French text (percentages of the letters only)
+_FREQUENCES_LETTRES = {
+    'A': 7.636, 'B': 0.901, 'C': 3.260, 'D': 3.669, 'E': 14.715, 'F': 1.066,
+    'G': 0.866, 'H': 0.737, 'I': 7.529, 'J': 0.613, 'K': 0.074, 'L': 5.456,
+    'M': 2.968, 'N': 7.095, 'O': 5.796, 'P': 2.521, 'Q': 1.362, 'R': 6.693,
+    'S': 7.948, 'T': 7.244, 'U': 6.311, 'V': 1.838, 'W': 0.049, 'X': 0.427,
+    'Y': 0.128, 'Z': 0.326,
+}
+
+# Share of spaces in French text (average word length is close to 5 letters)
+_FREQUENCE_ESPACE = 0.17
+
+# Expected proportion of each of the 27 symbols, indexed like ALPHABET
+FREQUENCES_FRANCAIS = tuple(
+    _FREQUENCE_ESPACE if symbole == ' '
+    else (1 - _FREQUENCE_ESPACE) * _FREQUENCES_LETTRES[symbole] / sum(_FREQUENCES_LETTRES.values())
+    for symbole in ALPHABET
+)
+
+# Every valid key (a, b) modulo 27
+CLES_VALIDES = tuple((a, b) for a in range(1, 27) if pgcd(a, 27) == 1 for b in range(27))
+
+# For each key, the ciphertext position of every plaintext position M:
+# the plaintext count of M is the ciphertext count of (a*M + b) mod 27
+_PERMUTATIONS = tuple(tuple((a * M + b) % 27 for M in range(27)) for a, b in CLES_VALIDES)
+
+_POIDS = tuple(1 / f for f in FREQUENCES_FRANCAIS)
+
+_IDENTITE = tuple(range(27))
+
+
+def compter_symboles(texte):
+    """
+    Count the occurrences of each alphabet symbol in a text.
+
+    Args:
+        texte (str): Input text (converted to uppercase, other characters ignored)
+
+    Returns:
+        list: 27 counts, indexed like ALPHABET
+    """
+    texte = texte.upper()
+    return [texte.count(symbole) for symbole in ALPHABET]
+
+
+def score_chi2(comptes):
+    """
+    Chi-squared distance between symbol counts and French frequencies.
+
+    Args:
+        comptes (list): 27 symbol counts, indexed like ALPHABET
+
+    Returns:
+        float: Chi-squared score (lower means closer to French)
+    """
+    total = sum(comptes)
+    if total == 0:
+        return 0.0
+    return _chi2([o * o for o in comptes], _IDENTITE, total)
+
+
+def _chi2(carres, permutation, total):
+    """
+    Chi-squared score of the counts read in the order of 'permutation'.
+
+    carres holds the squared counts: ranking the keys squares them once and
+    only changes the permutation.
+    """
+    somme = 0.0
+    poids = _POIDS
+    for M in range(27):
+        somme += carres[permutation[M]] * poids[M]
+    # sum((o - N*f)^2 / (N*f)) simplifies to sum(o^2 / f) / N - N
+    return somme / total - total
+
+
+def classer_cles(message_chiffre):
+    """
+    Rank all 486 keys by the chi-squared score of the corresponding plaintext.
+
+    Args:
+        message_chiffre (str): The encrypted message
+
+    Returns:
+        list: Tuples (score, a, b) sorted from the most to the least likely key
+    """
+    comptes = compter_symboles(message_chiffre)
+    total = sum(comptes)
+    if total == 0:
+        return [(0.0, a, b) for a, b in CLES_VALIDES]
+
+    carres = [c * c for c in comptes]
+    scores = [(_chi2(carres, permutation, total), a, b)
+              for (a, b), permutation in zip(CLES_VALIDES, _PERMUTATIONS)]
+
+    scores.sort()
+    return scores
+
+
+def cryptanalyser(message_chiffre, nb_candidats=5):
+    """
+    Recover the most likely plaintexts of an Affine-encrypted message.
+
+    Args:
+        message_chiffre (str): The encrypted message
+        nb_candidats (int): Number of candidates to decrypt and return
+
+    Returns:
+        list: Tuples (score, a, b, message_dechiffre), best candidate first
+
+    Example:
+        >>> chiffre = chiffrer_affine("IL FAIT BEAU AUJOURD HUI A PARIS", 5, 8)
+        >>> cryptanalyser(chiffre, 1)[0][1:3]
+        (5, 8)
+    """
+    return [
+        (score, a, b, CleAffine(a, b).dechiffrer(message_chiffre))
+        for score, a, b in classer_cles(message_chiffre)[:nb_candidats]
+    ]
+
+
+def cryptanalyser_lot(messages_chiffres, nb_candidats=1):
+    """
+    Run `cryptanalyser` on many intercepted messages.
+
+    Args:
+        messages_chiffres (iterable): Encrypted messages
+        nb_candidats (int): Number of candidates kept for each message
+
+    Returns:
+        list: One list of candidates per message, in input order
+    """
+    return [cryptanalyser(message, nb_candidats) for message in messages_chiffres]
+
+
+def benchmark_cryptanalyse(nb_messages=500, longueur=200):
+    """
+    Measure how many messages per second `cryptanalyser_lot` can break.
+
+    Args:
+        nb_messages (int): Number of random messages to attack
+        longueur (int): Length of each message, in characters
+    """
+    symboles = list(ALPHABET)
+    messages = []
+    cles = []
+    for _ in range(nb_messages):
+        clair = "".join(random.choices(symboles, weights=FREQUENCES_FRANCAIS, k=longueur))
+        a, b = random.choice(CLES_VALIDES)
+        cles.append((a, b))
+        messages.append(chiffrer_affine(clair, a, b))
+
+    debut = time.perf_counter()
+    resultats = cryptanalyser_lot(messages)
+    duree = time.perf_counter() - debut
+
+    trouves = sum(1 for (a, b), candidats in zip(cles, resultats)
+                  if candidats[0][1:3] == (a, b))
+    print(f"{nb_messages} messages de {longueur} caractères en {duree:.3f} s")
+    print(f"Débit        : {nb_messages / duree:.0f} messages/s")
+    print(f"Clés trouvées: {trouves}/{nb_messages}")
+
+
+def main():
+    """
+    Interactive attack on a message typed by the user.
+    """
+    print("=" * 60)
+    print("     CRYPTANALYSE DU CHIFFREMENT AFFINE (486 clés)")
+    print("=" * 60)
+
+    message_chiffre = input("\nEntrez le message chiffré: ")
+    if not message_chiffre:
+        print("Message vide!")
+        return
+
+    print(f"\n{'Rang':>4} | {'a':>2} | {'b':>2} | {'Score':>10} | Message")
+    print("-" * 60)
+    for rang, (score, a, b, texte) in enumerate(cryptanalyser(message_chiffre), 1):
+        print(f"{rang:>4} | {a:>2} | {b:>2} | {score:10.2f} | {texte}")
+
+
+if __name__ == "__main__":
+    main()
@@ -10,8 +10,16 @@ Author: [Your Name]
 License: MIT
 """
 
+import array
+import os
 import random
 import math
+import struct
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import modlinalg
 
 
 def pgcd(a, b):
@@ -189,6 +197,96 @@ def generer_matrice_inversible(n, max_tentatives=100):
     return None
 
 
+def transposer_matrice(matrice):
+    """
+    Transpose a matrix.
+    
+    Args:
+        matrice (list): Matrix to transpose
+    
+    Returns:
+        list: Transposed matrix
+    """
+    return [list(colonne) for colonne in zip(*matrice)]
+
+
+def _inverser_triangulaire_unitaire(matrice, m):
+    """
+    Invert a lower triangular matrix with ones on the diagonal, modulo m.
+    
+    Forward substitution, row by row: since L.L^(-1) = I, row i of L^(-1)
+    is e_i minus the combination of the previous rows of L^(-1).
+    """
+    n = len(matrice)
+    inverse = []
+    
+    for i in range(n):
+        ligne = [0] * n
+        ligne[i] = 1
+        coefficients = matrice[i]
+        for k in range(i):
+            facteur = coefficients[k]
+            if facteur:
+                ligne_k = inverse[k]
+                for j in range(k + 1):
+                    ligne[j] -= facteur * ligne_k[j]
+        inverse.append([x % m for x in ligne])
+    
+    return inverse
+
+
+def generer_cle_inversible(n, m=27):
+    """
+    Generate a random invertible matrix and its inverse, without retries.
+    
+    The matrix is built as K = P.L.D.U where:
+        - P is a random permutation matrix
+        - L is a random lower triangular matrix with ones on the diagonal
+        - D is a random diagonal matrix of invertible elements modulo m
+        - U is a random upper triangular matrix with ones on the diagonal
+    
+    Every factor is invertible by construction, so K is too, and its inverse
+    K^(-1) = U^(-1).D^(-1).L^(-1).P^(-1) only needs two triangular inversions.
+    The cost is O(n^3) with no Gauss-Jordan and no failed attempts.
+    
+    Args:
+        n (int): Size of the matrix
+        m (int): The modulus
+    
+    Returns:
+        tuple: (matrix, inverse_matrix)
+    """
+    unites = [x for x in range(1, m) if pgcd(x, m) == 1]
+    
+    inferieure = [[random.randrange(m) for _ in range(i)] + [1] + [0] * (n - i - 1)
+                  for i in range(n)]
+    superieure_t = [[random.randrange(m) for _ in range(i)] + [1] + [0] * (n - i - 1)
+                    for i in range(n)]
+    diagonale = [random.choice(unites) for _ in range(n)]
+    diagonale_inv = [inverse_modulaire(d, m) for d in diagonale]
+    permutation = list(range(n))
+    random.shuffle(permutation)
+    
+    # L.D scales the columns of L, D^(-1).L^(-1) scales the rows of L^(-1)
+    inferieure_d = [[x * d for x, d in zip(ligne, diagonale)] for ligne in inferieure]
+    inferieure_inv = _inverser_triangulaire_unitaire(inferieure, m)
+    inferieure_inv_d = [[x * d_inv for x in ligne]
+                        for ligne, d_inv in zip(inferieure_inv, diagonale_inv)]
+    
+    # U is stored transposed so that both triangular inversions are "lower"
+    superieure = transposer_matrice(superieure_t)
+    superieure_inv = transposer_matrice(_inverser_triangulaire_unitaire(superieure_t, m))
+    
+    produit = modlinalg.multiplier(inferieure_d, superieure, m)
+    produit_inv = modlinalg.multiplier(superieure_inv, inferieure_inv_d, m)
+    
+    # P permutes the rows of L.D.U, so P^(-1) permutes the columns of its inverse
+    matrice = [produit[permutation[i]] for i in range(n)]
+    inverse = [[ligne[permutation[j]] for j in range(n)] for ligne in produit_inv]
+    
+    return matrice, inverse
+
+
 def multiplier_matrice_vecteur_mod27(matrice, vecteur):
     """
     Multiply a matrix by a vector modulo 27.
@@ -306,6 +404,686 @@ def dechiffrer_hill(message_chiffre, matrice_cle_inverse):
     return chiffrer_hill(message_chiffre, matrice_cle_inverse)
 
 
+# Byte-level conversion tables: symbol <-> number (A=0, ..., Z=25, space=26)
+_ALPHABET = b"ABCDEFGHIJKLMNOPQRSTUVWXYZ "
+_TABLE_NOMBRES = bytes.maketrans(_ALPHABET, bytes(range(27)))
+_TABLE_LETTRES = bytes.maketrans(bytes(range(27)), _ALPHABET)
+_CARACTERES_IGNORES = bytes(c for c in range(256) if c not in _ALPHABET)
+
+# _TABLE_MOD27[x] = x mod 27, and _TABLES_PRODUIT[k][x] = k * x mod 27
+_TABLE_MOD27 = bytes(x % 27 for x in range(256))
+_TABLES_PRODUIT = [bytes((k * x) % 27 if x < 27 else 0 for x in range(256)) for k in range(27)]
+
+# Number of values <= 26 that can be added in one byte without overflow
+_TERMES_PAR_OCTET = 255 // 26
+
+
+def texte_vers_octets(texte):
+    """
+    Convert text to a byte string of numbers (A=0, B=1, ..., Z=25, space=26).
+    
+    Same result as texte_vers_nombres, but computed with `bytes.translate`
+    and returned as bytes instead of a list.
+    
+    Args:
+        texte (str): Input text
+    
+    Returns:
+        bytes: One byte per kept character
+    """
+    # Non-ASCII characters can never be A-Z or space once uppercased
+    octets = texte.upper().encode("ascii", "ignore")
+    return octets.translate(_TABLE_NOMBRES, _CARACTERES_IGNORES)
+
+
+def octets_vers_texte(nombres):
+    """
+    Convert a byte string of numbers (0-26) back to text.
+    
+    Args:
+        nombres (bytes): Numbers between 0 and 26
+    
+    Returns:
+        str: Resulting text
+    """
+    return bytes(nombres).translate(_TABLE_LETTRES).decode("ascii")
+
+
+def multiplier_blocs_mod27(nombres, matrice):
+    """
+    Multiply every block of n numbers by the matrix modulo 27, in one pass.
+    
+    The blocks are the columns of an (n x blocks) matrix P, so the result is
+    the matrix product K.P. Column j of P is the byte slice nombres[j::n].
+    Each row of the result is accumulated with whole-message operations:
+    
+        1. `bytes.translate` multiplies every element of a slice by K[i][j]
+        2. the slices are read as big integers with one number per byte and
+           added together (at most 9 values <= 26, so no byte overflows)
+        3. `bytes.translate` reduces every byte modulo 27
+    
+    Args:
+        nombres (bytes): Numbers between 0 and 26, length multiple of n
+        matrice (list): Square key matrix (n x n)
+    
+    Returns:
+        bytearray: The multiplied blocks, in the same layout as 'nombres'
+    """
+    n = len(matrice)
+    nb_blocs = len(nombres) // n
+    colonnes = [nombres[j::n] for j in range(n)]
+    resultat = bytearray(len(nombres))
+    
+    for i in range(n):
+        somme = 0
+        termes = 0
+        for j in range(n):
+            coefficient = matrice[i][j] % 27
+            if coefficient == 0:
+                continue
+            # Reduce modulo 27 before the bytes could overflow
+            if termes == _TERMES_PAR_OCTET:
+                octets = somme.to_bytes(nb_blocs, "little").translate(_TABLE_MOD27)
+                somme = int.from_bytes(octets, "little")
+                termes = 1
+            produit = colonnes[j].translate(_TABLES_PRODUIT[coefficient])
+            somme += int.from_bytes(produit, "little")
+            termes += 1
+        
+        resultat[i::n] = somme.to_bytes(nb_blocs, "little").translate(_TABLE_MOD27)
+    
+    return resultat
+
+
+def chiffrer_hill_rapide(message, matrice_cle):
+    """
+    Encrypt a message using the Hill cipher, processing all blocks at once.
+    
+    Same result as chiffrer_hill (including the space padding), computed by
+    multiplier_blocs_mod27 instead of one matrix-vector product per block.
+    
+    Args:
+        message (str): Plaintext message
+        matrice_cle (list): Encryption key matrix
+    
+    Returns:
+        str: Encrypted message
+    """
+    n = len(matrice_cle)
+    nombres = texte_vers_octets(message)
+    
+    # Pad message if necessary to make length a multiple of n
+    reste = len(nombres) % n
+    if reste != 0:
+        nombres += bytes([26]) * (n - reste)  # Add spaces for padding
+    
+    return octets_vers_texte(multiplier_blocs_mod27(nombres, matrice_cle))
+
+
+def dechiffrer_hill_rapide(message_chiffre, matrice_cle_inverse):
+    """
+    Decrypt a message encrypted with the Hill cipher, processing all blocks at once.
+    
+    Args:
+        message_chiffre (str): Encrypted message
+        matrice_cle_inverse (list): Inverse of the encryption key matrix
+    
+    Returns:
+        str: Decrypted message
+    """
+    return chiffrer_hill_rapide(message_chiffre, matrice_cle_inverse)
+
+
+def _completer_blocs(nombres, n):
+    """
+    Pad a byte string of numbers with spaces (26) to a multiple of n.
+    """
+    reste = len(nombres) % n
+    if reste != 0:
+        nombres = bytes(nombres) + bytes([26]) * (n - reste)
+    return nombres
+
+
+class HillKey:
+    """
+    Hill cipher key with its inverse computed once and stored compactly.
+    
+    Both matrices are stored as row-major `bytes` (one byte per coefficient
+    modulo 27). The inverse is only computed, with modlinalg.inverser, the
+    first time it is needed, or it can be supplied (e.g. from
+    generer_cle_inversible) or reloaded from a serialised key.
+    
+    encrypt / decrypt accept:
+        - str: text, normalised like chiffrer_hill, returns str
+        - bytes / bytearray / memoryview: ASCII text, returns the result
+          as ASCII bytes
+        - array.array (any integer type), list or tuple of integers, already
+          encoded (reduced modulo 27), returns an array.array('B') of
+          numbers 0-26; array('B') and lists of numbers 0-255 take the
+          fastest path
+    
+    Args:
+        matrice (list): Square key matrix (n x n)
+        inverse (list or None): Its inverse modulo 27, if already known
+    
+    Example:
+        >>> cle = HillKey(*generer_cle_inversible(3))
+        >>> cle.decrypt(cle.encrypt("ATTAQUE A L AUBE"))
+        'ATTAQUE A L AUBE  '
+    """
+    
+    _MAGIC = b"HILL"
+    
+    def __init__(self, matrice, inverse=None):
+        n = len(matrice)
+        if n == 0 or any(len(ligne) != n for ligne in matrice):
+            raise ValueError("La matrice de chiffrement doit être carrée")
+        
+        self.n = n
+        self._cle = bytes(x % 27 for ligne in matrice for x in ligne)
+        self._inverse = None if inverse is None else bytes(x % 27 for ligne in inverse for x in ligne)
+        self._lignes_cle = self._lignes(self._cle)
+        self._lignes_inverse = None
+    
+    def _lignes(self, coefficients):
+        """
+        Split row-major coefficients into rows, as used by multiplier_blocs_mod27.
+        """
+        n = self.n
+        return [coefficients[i * n:(i + 1) * n] for i in range(n)]
+    
+    @property
+    def matrice(self):
+        """
+        list: The encryption key matrix.
+        """
+        return [list(ligne) for ligne in self._lignes_cle]
+    
+    @property
+    def inverse(self):
+        """
+        list: The decryption matrix, computed on first use.
+        
+        Raises:
+            ValueError: If the key matrix is not invertible modulo 27
+        """
+        return [list(ligne) for ligne in self._preparer_inverse()]
+    
+    def _preparer_inverse(self):
+        """
+        Return the rows of the inverse matrix, computing it if needed.
+        """
+        if self._lignes_inverse is None:
+            if self._inverse is None:
+                inverse = modlinalg.inverser(self.matrice, 27)
+                if inverse is None:
+                    raise ValueError("La matrice de chiffrement n'est pas inversible modulo 27")
+                self._inverse = bytes(x for ligne in inverse for x in ligne)
+            self._lignes_inverse = self._lignes(self._inverse)
+        return self._lignes_inverse
+    
+    def _appliquer(self, donnees, lignes):
+        """
+        Encode 'donnees', multiply all its blocks by 'lignes' and decode the
+        result to the type of the input.
+        """
+        if isinstance(donnees, str):
+            nombres = _completer_blocs(texte_vers_octets(donnees), self.n)
+            return octets_vers_texte(multiplier_blocs_mod27(nombres, lignes))
+        
+        if isinstance(donnees, (bytes, bytearray, memoryview)):
+            nombres = bytes(donnees).upper().translate(_TABLE_NOMBRES, _CARACTERES_IGNORES)
+            nombres = _completer_blocs(nombres, self.n)
+            return bytes(multiplier_blocs_mod27(nombres, lignes).translate(_TABLE_LETTRES))
+        
+        # Numbers are reduced modulo 27 like the key coefficients: with a
+        # single translate when they fit in a byte, one by one otherwise
+        # (wider or signed array types, negative numbers)
+        octets = None
+        if isinstance(donnees, array.array):
+            if donnees.typecode == "B":
+                octets = donnees.tobytes()
+        elif isinstance(donnees, (list, tuple)):
+            try:
+                octets = bytes(donnees)
+            except ValueError:
+                pass
+        if octets is None:
+            nombres = bytes(x % 27 for x in donnees)
+        else:
+            nombres = octets.translate(_TABLE_MOD27)
+        nombres = _completer_blocs(nombres, self.n)
+        return array.array("B", multiplier_blocs_mod27(nombres, lignes))
+    
+    def encrypt(self, donnees):
+        """
+        Encrypt text, ASCII bytes or pre-encoded numbers.
+        
+        Args:
+            donnees (str, bytes or array): Plaintext
+        
+        Returns:
+            str, bytes or array: Ciphertext, see the class documentation
+        """
+        return self._appliquer(donnees, self._lignes_cle)
+    
+    def decrypt(self, donnees):
+        """
+        Decrypt text, ASCII bytes or pre-encoded numbers.
+        
+        Args:
+            donnees (str, bytes or array): Ciphertext
+        
+        Returns:
+            str, bytes or array: Plaintext, see the class documentation
+        
+        Raises:
+            ValueError: If the key matrix is not invertible modulo 27
+        """
+        return self._appliquer(donnees, self._preparer_inverse())
+    
+    def to_bytes(self):
+        """
+        Serialise the key, including its inverse if it has been computed.
+        
+        Format: b"HILL", n (2 bytes, big endian), 1 byte set to 1 if the
+        inverse follows, the n*n key coefficients, then the n*n inverse ones.
+        
+        Returns:
+            bytes: Serialised key
+        """
+        entete = self._MAGIC + struct.pack(">HB", self.n, self._inverse is not None)
+        return entete + self._cle + (self._inverse or b"")
+    
+    @classmethod
+    def from_bytes(cls, donnees):
+        """
+        Load a key serialised with to_bytes, without recomputing the inverse.
+        
+        Args:
+            donnees (bytes): Serialised key
+        
+        Returns:
+            HillKey: The loaded key
+        
+        Raises:
+            ValueError: If the data is not a valid serialised key
+        """
+        donnees = bytes(donnees)
+        if donnees[:4] != cls._MAGIC or len(donnees) < 7:
+            raise ValueError("Données de clé de Hill invalides")
+        
+        n, avec_inverse = struct.unpack_from(">HB", donnees, 4)
+        taille = n * n
+        if n == 0 or len(donnees) != 7 + taille * (2 if avec_inverse else 1):
+            raise ValueError("Données de clé de Hill invalides")
+        
+        cle = cls.__new__(cls)
+        cle.n = n
+        cle._cle = donnees[7:7 + taille]
+        cle._inverse = donnees[7 + taille:] if avec_inverse else None
+        cle._lignes_cle = cle._lignes(cle._cle)
+        cle._lignes_inverse = None
+        return cle
+    
+    def save(self, chemin):
+        """
+        Write the key (and its inverse, computed if needed) to a file.
+        
+        Args:
+            chemin (str): Path of the file to write
+        """
+        self._preparer_inverse()
+        with open(chemin, "wb") as f:
+            f.write(self.to_bytes())
+    
+    @classmethod
+    def load(cls, chemin):
+        """
+        Read a key written by save.
+        
+        Args:
+            chemin (str): Path of the key file
+        
+        Returns:
+            HillKey: The loaded key
+        """
+        with open(chemin, "rb") as f:
+            return cls.from_bytes(f.read())
+
+
+def _multiplier_segment(nom_entree, nom_sortie, debut, fin, matrice, en_lettres):
+    """
+    Worker: multiply the blocks of entree[debut:fin] and write them to
+    sortie[debut:fin], both buffers being shared memory blocks.
+    """
+    entree = shared_memory.SharedMemory(name=nom_entree)
+    sortie = shared_memory.SharedMemory(name=nom_sortie)
+    try:
+        resultat = multiplier_blocs_mod27(bytes(entree.buf[debut:fin]), matrice)
+        if en_lettres:
+            resultat = resultat.translate(_TABLE_LETTRES)
+        sortie.buf[debut:fin] = resultat
+    finally:
+        entree.close()
+        sortie.close()
+
+
+def multiplier_blocs_parallele(nombres, matrice, processus=None, en_lettres=False,
+                               segments_par_processus=4):
+    """
+    Multiply the blocks of a number stream by the matrix, on several processes.
+    
+    The stream is copied once into a shared memory block and cut into
+    segments at block boundaries. Each worker reads its segment from shared
+    memory and writes its result at the same offset of a shared output block,
+    so nothing but offsets is pickled and no reassembly is needed.
+    
+    Args:
+        nombres (bytes): Numbers between 0 and 26, length multiple of n
+        matrice (list): Square key matrix (n x n)
+        processus (int or None): Number of worker processes (None: one per CPU)
+        en_lettres (bool): Convert the output numbers to letters in the workers
+        segments_par_processus (int): Number of segments per worker process
+    
+    Returns:
+        bytes: The multiplied blocks (as letters if 'en_lettres')
+    """
+    n = len(matrice)
+    longueur = len(nombres)
+    if longueur == 0:
+        return b""
+    
+    processus = processus or os.cpu_count() or 1
+    nb_blocs = longueur // n
+    blocs_par_segment = -(-nb_blocs // (processus * segments_par_processus))
+    taille_segment = blocs_par_segment * n
+    matrice = [[x % 27 for x in ligne] for ligne in matrice]
+    
+    entree = shared_memory.SharedMemory(create=True, size=longueur)
+    sortie = shared_memory.SharedMemory(create=True, size=longueur)
+    try:
+        entree.buf[:longueur] = nombres
+        with ProcessPoolExecutor(max_workers=processus) as executeur:
+            taches = [
+                executeur.submit(_multiplier_segment, entree.name, sortie.name, debut,
+                                 min(debut + taille_segment, longueur), matrice, en_lettres)
+                for debut in range(0, longueur, taille_segment)
+            ]
+            for tache in taches:
+                tache.result()
+        return bytes(sortie.buf[:longueur])
+    finally:
+        entree.close()
+        entree.unlink()
+        sortie.close()
+        sortie.unlink()
+
+
+def chiffrer_hill_parallele(message, matrice_cle, processus=None):
+    """
+    Encrypt a large message using the Hill cipher on several processes.
+    
+    Same result as chiffrer_hill (including the space padding).
+    
+    Args:
+        message (str): Plaintext message
+        matrice_cle (list): Encryption key matrix
+        processus (int or None): Number of worker processes (None: one per CPU)
+    
+    Returns:
+        str: Encrypted message
+    """
+    nombres = _completer_blocs(texte_vers_octets(message), len(matrice_cle))
+    return multiplier_blocs_parallele(nombres, matrice_cle, processus, en_lettres=True).decode("ascii")
+
+
+def dechiffrer_hill_parallele(message_chiffre, matrice_cle_inverse, processus=None):
+    """
+    Decrypt a large message encrypted with the Hill cipher on several processes.
+    
+    Args:
+        message_chiffre (str): Encrypted message
+        matrice_cle_inverse (list): Inverse of the encryption key matrix
+        processus (int or None): Number of worker processes (None: one per CPU)
+    
+    Returns:
+        str: Decrypted message
+    """
+    return chiffrer_hill_parallele(message_chiffre, matrice_cle_inverse, processus)
+
+
+def benchmark_hill_parallele(taille=1 << 30, n=3, processus_max=None):
+    """
+    Measure how multiplier_blocs_parallele scales with the number of processes.
+    
+    The input is a random stream of numbers (already encoded text), so only
+    the block multiplication is measured.
+    
+    Args:
+        taille (int): Size of the stream in bytes (default: 1 GiB)
+        n (int): Size of the key matrix
+        processus_max (int or None): Largest number of processes (None: CPU count)
+    """
+    processus_max = processus_max or os.cpu_count() or 1
+    matrice_cle, _ = generer_cle_inversible(n)
+    taille -= taille % n
+    nombres = os.urandom(taille).translate(_TABLE_MOD27)
+    
+    print(f"\nFlot de {taille / 2**20:.0f} Mio, matrice {n}x{n}")
+    print(f"{'Processus':>9} | {'Durée (s)':>10} | {'Mo/s':>8} | {'Accélération':>12}")
+    print("-" * 49)
+    reference = None
+    processus = 1
+    while True:
+        debut = time.perf_counter()
+        multiplier_blocs_parallele(nombres, matrice_cle, processus)
+        duree = time.perf_counter() - debut
+        reference = reference or duree
+        print(f"{processus:>9} | {duree:10.2f} | {taille / duree / 1e6:8.1f} | {reference / duree:12.2f}")
+        
+        if processus >= processus_max:
+            break
+        processus = min(processus * 2, processus_max)
+
+
+# _TABLES_PRODUIT_256[k][x] = k * x mod 256
+_TABLES_PRODUIT_256 = [bytes((k * x) % 256 for x in range(256)) for k in range(256)]
+
+# Number of bytes that can be added in a 16-bit lane without overflow
+_TERMES_PAR_MOT = 65535 // 255
+
+# Size of the segments processed at once by multiplier_blocs_mod256 (in blocks)
+_BLOCS_PAR_SEGMENT = 1 << 16
+
+
+def _multiplier_segment_mod256(segment, matrice):
+    """
+    Multiply the blocks of one segment by the matrix modulo 256.
+    
+    Same method as multiplier_blocs_mod27, except that products modulo 256
+    use every bit of a byte: the columns are spread over 16-bit lanes so the
+    carries of the additions stay in the high byte, which is dropped.
+    """
+    n = len(matrice)
+    nb_blocs = len(segment) // n
+    colonnes = [bytes(segment[j::n]) for j in range(n)]
+    resultat = bytearray(len(segment))
+    mots = bytearray(2 * nb_blocs)
+    
+    for i in range(n):
+        somme = 0
+        termes = 0
+        for j in range(n):
+            coefficient = matrice[i][j] % 256
+            if coefficient == 0:
+                continue
+            if termes == _TERMES_PAR_MOT:
+                mots[0::2] = somme.to_bytes(2 * nb_blocs, "little")[0::2]
+                mots[1::2] = bytes(nb_blocs)
+                somme = int.from_bytes(mots, "little")
+                termes = 1
+            mots[0::2] = colonnes[j].translate(_TABLES_PRODUIT_256[coefficient])
+            mots[1::2] = bytes(nb_blocs)
+            somme += int.from_bytes(mots, "little")
+            termes += 1
+        
+        resultat[i::n] = somme.to_bytes(2 * nb_blocs, "little")[0::2]
+    
+    return resultat
+
+
+def multiplier_blocs_mod256(donnees, matrice, sortie=None):
+    """
+    Multiply every block of n bytes by the matrix modulo 256.
+    
+    The input is read through memoryview slices, one segment at a time, so
+    large buffers are never copied as a whole.
+    
+    Args:
+        donnees (bytes-like): Input bytes, length multiple of n
+        matrice (list): Square key matrix (n x n)
+        sortie (bytearray or None): Output buffer of the same length, None to
+            allocate a new one
+    
+    Returns:
+        bytearray: The multiplied blocks ('sortie' if given)
+    """
+    n = len(matrice)
+    vue = memoryview(donnees).cast("B")
+    if sortie is None:
+        sortie = bytearray(len(vue))
+    
+    taille_segment = _BLOCS_PAR_SEGMENT * n
+    for debut in range(0, len(vue), taille_segment):
+        fin = min(debut + taille_segment, len(vue))
+        sortie[debut:fin] = _multiplier_segment_mod256(vue[debut:fin], matrice)
+    
+    return sortie
+
+
+def chiffrer_hill_octets(donnees, matrice_cle):
+    """
+    Encrypt binary data using the Hill cipher modulo 256.
+    
+    The data is padded PKCS#7-style: k bytes of value k are appended
+    (1 <= k <= n) so that the length becomes a multiple of n. The key must be
+    invertible modulo 256 (see generer_cle_inversible(n, 256)).
+    
+    Args:
+        donnees (bytes-like): Plaintext bytes
+        matrice_cle (list): Encryption key matrix (n <= 255)
+    
+    Returns:
+        bytes: Encrypted data
+    """
+    n = len(matrice_cle)
+    if n > 255:
+        raise ValueError("La taille de bloc doit être au plus 255 octets")
+    
+    vue = memoryview(donnees).cast("B")
+    complet = len(vue) - len(vue) % n
+    remplissage = n - len(vue) % n
+    
+    sortie = bytearray(complet + n)
+    multiplier_blocs_mod256(vue[:complet], matrice_cle, memoryview(sortie)[:complet])
+    dernier_bloc = bytes(vue[complet:]) + bytes([remplissage]) * remplissage
+    sortie[complet:] = multiplier_blocs_mod256(dernier_bloc, matrice_cle)
+    
+    return bytes(sortie)
+
+
+def dechiffrer_hill_octets(donnees, matrice_cle_inverse):
+    """
+    Decrypt binary data encrypted with chiffrer_hill_octets.
+    
+    Args:
+        donnees (bytes-like): Encrypted data
+        matrice_cle_inverse (list): Inverse of the key matrix modulo 256
+            (see modlinalg.inverser(matrice, 256))
+    
+    Returns:
+        bytes: Decrypted data
+    
+    Raises:
+        ValueError: If the length or the padding is invalid
+    """
+    n = len(matrice_cle_inverse)
+    vue = memoryview(donnees).cast("B")
+    if len(vue) == 0 or len(vue) % n != 0:
+        raise ValueError("La longueur des données chiffrées doit être un multiple de la taille de bloc")
+    
+    clair = multiplier_blocs_mod256(vue, matrice_cle_inverse)
+    remplissage = clair[-1]
+    if not 1 <= remplissage <= n or clair[-remplissage:] != bytes([remplissage]) * remplissage:
+        raise ValueError("Remplissage invalide")
+    
+    del clair[-remplissage:]
+    return bytes(clair)
+
+
+def benchmark_hill_octets(tailles=(1_000, 1_000_000, 100_000_000), n=8):
+    """
+    Measure the throughput of chiffrer_hill_octets / dechiffrer_hill_octets.
+    
+    Args:
+        tailles (tuple): Data sizes to measure, in bytes
+        n (int): Size of the key matrix
+    """
+    matrice_cle, matrice_inverse = generer_cle_inversible(n, 256)
+    
+    print(f"\n{'Taille':>12} | {'chiffrement (Mo/s)':>18} | {'déchiffrement (Mo/s)':>20}")
+    print("-" * 56)
+    for taille in tailles:
+        donnees = os.urandom(taille)
+        
+        debut = time.perf_counter()
+        chiffre = chiffrer_hill_octets(donnees, matrice_cle)
+        duree_chiffrement = time.perf_counter() - debut
+        
+        debut = time.perf_counter()
+        dechiffrer_hill_octets(chiffre, matrice_inverse)
+        duree_dechiffrement = time.perf_counter() - debut
+        
+        print(f"{taille:>12} | {taille / duree_chiffrement / 1e6:18.2f} | "
+              f"{taille / duree_dechiffrement / 1e6:20.2f}")
+
+
+def benchmark_hill(tailles=(1_000, 1_000_000, 100_000_000), n=3, taille_max_boucle=1_000_000):
+    """
+    Compare the throughput of chiffrer_hill and chiffrer_hill_rapide.
+    
+    The block-by-block version is only measured up to 'taille_max_boucle'
+    characters, beyond that it would take minutes and is reported as skipped.
+    
+    Args:
+        tailles (tuple): Message sizes to measure, in characters
+        n (int): Size of the key matrix
+        taille_max_boucle (int): Largest size measured with chiffrer_hill
+    """
+    matrice_cle, _ = generer_cle_inversible(n)
+    
+    def duree(fonction, message):
+        debut = time.perf_counter()
+        fonction(message, matrice_cle)
+        return time.perf_counter() - debut
+    
+    print(f"\n{'Taille':>12} | {'chiffrer_hill (s)':>18} | {'rapide (s)':>11} | {'rapide (Mo/s)':>13}")
+    print("-" * 64)
+    for taille in tailles:
+        message = "".join(random.choices("ABCDEFGHIJKLMNOPQRSTUVWXYZ ", k=min(taille, 1 << 20)))
+        message = (message * (taille // len(message) + 1))[:taille]
+        
+        if taille <= taille_max_boucle:
+            boucle = f"{duree(chiffrer_hill, message):18.3f}"
+        else:
+            boucle = f"{'ignoré':>18}"
+        
+        rapide = duree(chiffrer_hill_rapide, message)
+        debit = taille / rapide / 1e6 if rapide > 0 else float("inf")
+        print(f"{taille:>12} | {boucle} | {rapide:11.3f} | {debit:13.2f}")
+
+
 def main():
     """
     Main function providing an interactive menu for Hill cipher operations.
@@ -351,7 +1129,7 @@ def main():
                 continue
             
             print(f"\nGénération d'une matrice {taille}x{taille} inversible modulo 27...")
-            resultat = generer_matrice_inversible(taille)
+            resultat = generer_cle_inversible(taille)
             
             if resultat:
                 matrice_cle, matrice_inverse = resultat
@@ -0,0 +1,236 @@
+"""
+Hill Cipher Cryptanalysis
+=========================
+Known-plaintext attack on the Hill cipher (A-Z + space, modulo 27).
+
+Each ciphertext block is C = K.P, so with n plaintext blocks stacked as the
+columns of an invertible matrix P and the matching ciphertext blocks as the
+columns of C, the key is K = C.P^(-1) mod 27.
+
+27 = 3^3 is not prime, but an integer matrix is invertible modulo 27 exactly
+when it is invertible modulo 3. The attack therefore:
+    1. selects n blocks that are linearly independent over GF(3), in a
+       single pass over the corpus (incremental row echelon form)
+    2. inverts P over GF(3)
+    3. lifts that inverse to modulo 27 with Newton's iteration
+       X <- X.(2I - P.X), which doubles the power of 3 at each step
+    4. checks the candidate key on the whole corpus at once with
+       multiplier_blocs_mod27
+
+Author: [Your Name]
+License: MIT
+"""
+
+import random
+
+from hill_cipher import afficher_matrice, multiplier_blocs_mod27, texte_vers_octets
+from modlinalg import multiplier
+
+
+def inverser_matrice_mod3(matrice):
+    """
+    Invert a matrix over GF(3) using Gauss-Jordan elimination.
+
+    Args:
+        matrice (list): Square matrix to invert (2D list)
+
+    Returns:
+        list or None: Inverse matrix modulo 3 if it exists, None otherwise
+    """
+    n = len(matrice)
+    augmentee = [[x % 3 for x in ligne] + [1 if i == j else 0 for j in range(n)]
+                 for i, ligne in enumerate(matrice)]
+
+    for col in range(n):
+        pivot_row = next((row for row in range(col, n) if augmentee[row][col]), -1)
+        if pivot_row == -1:
+            return None
+        augmentee[col], augmentee[pivot_row] = augmentee[pivot_row], augmentee[col]
+
+        # In GF(3) every non-zero element is its own inverse (1*1 = 2*2 = 1)
+        pivot = augmentee[col][col]
+        ligne_pivot = [(x * pivot) % 3 for x in augmentee[col]]
+        augmentee[col] = ligne_pivot
+
+        for row in range(n):
+            facteur = augmentee[row][col]
+            if row != col and facteur:
+                augmentee[row] = [(x - facteur * p) % 3
+                                  for x, p in zip(augmentee[row], ligne_pivot)]
+
+    return [ligne[n:] for ligne in augmentee]
+
+
+def relever_inverse(matrice, inverse_mod3, m=27):
+    """
+    Lift an inverse modulo 3 to an inverse modulo m (a power of 3).
+
+    If A.X = I (mod 3^k) then X' = X.(2I - A.X) satisfies A.X' = I (mod 3^2k).
+
+    Args:
+        matrice (list): Square matrix A
+        inverse_mod3 (list): Inverse of A modulo 3
+        m (int): Target modulus, a power of 3
+
+    Returns:
+        list: Inverse of A modulo m
+    """
+    n = len(matrice)
+    inverse = inverse_mod3
+    precision = 3
+
+    while precision < m:
+        precision *= precision
+        produit = multiplier(matrice, inverse, precision)
+        correction = [[((2 if i == j else 0) - produit[i][j]) % precision for j in range(n)]
+                      for i in range(n)]
+        inverse = multiplier(inverse, correction, precision)
+
+    return [[x % m for x in ligne] for ligne in inverse]
+
+
+def selectionner_blocs(blocs, n, ordre=None):
+    """
+    Choose n blocks that are linearly independent modulo 3.
+
+    The blocks are read in the given order and kept when they are not a
+    combination of the blocks already kept (each kept block is stored
+    reduced, with a pivot position set to 1).
+
+    Args:
+        blocs (list): Blocks of n numbers
+        n (int): Block size
+        ordre (iterable or None): Order in which to read the blocks
+
+    Returns:
+        list or None: Indices of the n chosen blocks, None if the blocks do
+        not span the whole space
+    """
+    base = []  # (pivot position, reduced vector with 1 at the pivot)
+    choisis = []
+
+    for indice in (range(len(blocs)) if ordre is None else ordre):
+        vecteur = [x % 3 for x in blocs[indice]]
+        for pivot, reduit in base:
+            facteur = vecteur[pivot]
+            if facteur:
+                vecteur = [(x - facteur * r) % 3 for x, r in zip(vecteur, reduit)]
+
+        pivot = next((j for j in range(n) if vecteur[j]), -1)
+        if pivot == -1:
+            continue
+
+        inverse_pivot = vecteur[pivot]  # Self-inverse in GF(3)
+        base.append((pivot, [(x * inverse_pivot) % 3 for x in vecteur]))
+        choisis.append(indice)
+        if len(choisis) == n:
+            return choisis
+
+    return None
+
+
+def retrouver_cle_hill(clair, chiffre, n, tentatives=1):
+    """
+    Recover an n x n Hill key from an aligned plaintext/ciphertext pair.
+
+    Args:
+        clair (str): Known plaintext
+        chiffre (str): The corresponding ciphertext (from chiffrer_hill)
+        n (int): Size of the key matrix
+        tentatives (int): Number of block selections to try; after the first
+            one (in corpus order) the blocks are read in random orders, which
+            helps when some of the pairs are corrupted
+
+    Returns:
+        list or None: The key matrix if one matches the whole corpus, None otherwise
+    """
+    nombres_clairs = texte_vers_octets(clair)
+    nombres_chiffres = texte_vers_octets(chiffre)
+
+    nb_blocs = min(len(nombres_clairs), len(nombres_chiffres)) // n
+    if nb_blocs < n or len(nombres_chiffres) % n != 0:
+        return None
+
+    longueur = nb_blocs * n
+    nombres_clairs = nombres_clairs[:longueur]
+    nombres_chiffres = nombres_chiffres[:longueur]
+    blocs_clairs = [nombres_clairs[k:k + n] for k in range(0, longueur, n)]
+
+    for tentative in range(tentatives):
+        ordre = None
+        if tentative > 0:
+            ordre = list(range(nb_blocs))
+            random.shuffle(ordre)
+
+        choisis = selectionner_blocs(blocs_clairs, n, ordre)
+        if choisis is None:
+            return None  # The plaintext never spans the space
+
+        # Chosen blocks as the columns of P and C
+        matrice_clair = [[nombres_clairs[k * n + r] for k in choisis] for r in range(n)]
+        matrice_chiffre = [[nombres_chiffres[k * n + r] for k in choisis] for r in range(n)]
+
+        inverse = relever_inverse(matrice_clair, inverser_matrice_mod3(matrice_clair))
+        cle = multiplier(matrice_chiffre, inverse, 27)
+
+        if multiplier_blocs_mod27(nombres_clairs, cle) == nombres_chiffres:
+            return cle
+
+    return None
+
+
+def attaque_texte_clair_connu(clair, chiffre, tailles=range(2, 11), tentatives=1):
+    """
+    Try every candidate key size and return the keys consistent with the corpus.
+
+    Args:
+        clair (str): Known plaintext
+        chiffre (str): The corresponding ciphertext
+        tailles (iterable): Candidate key sizes
+        tentatives (int): Number of block selections tried per size
+
+    Returns:
+        list: Tuples (n, key_matrix) for each size where a key was found
+
+    Example:
+        >>> from hill_cipher import chiffrer_hill, generer_cle_inversible
+        >>> cle, _ = generer_cle_inversible(3)
+        >>> clair = "UN TEXTE CONNU ASSEZ LONG POUR L ATTAQUE"
+        >>> attaque_texte_clair_connu(clair, chiffrer_hill(clair, cle))[0] == (3, cle)
+        True
+    """
+    resultats = []
+    for n in tailles:
+        cle = retrouver_cle_hill(clair, chiffre, n, tentatives)
+        if cle is not None:
+            resultats.append((n, cle))
+    return resultats
+
+
+def main():
+    """
+    Interactive known-plaintext attack.
+    """
+    print("=" * 70)
+    print("     CRYPTANALYSE DE HILL - Attaque à texte clair connu")
+    print("=" * 70)
+
+    clair = input("\nTexte clair connu: ")
+    chiffre = input("Texte chiffré correspondant: ")
+    try:
+        taille_max = int(input("Taille maximale de la matrice (ex: 10): "))
+    except ValueError:
+        print("Veuillez entrer un nombre entier!")
+        return
+
+    resultats = attaque_texte_clair_connu(clair, chiffre, range(2, taille_max + 1))
+    if not resultats:
+        print("\n✗ Aucune clé trouvée (texte trop court ou non aligné)")
+        return
+
+    for n, cle in resultats:
+        afficher_matrice(cle, f"Clé trouvée ({n}x{n})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,356 @@
+"""
+Modular Linear Algebra
+======================
+Determinant, rank, linear system solving and matrix inversion over Z/mZ,
+shared by the Hill cipher tools.
+
+Matrices are 2D lists of integers, as in hill_cipher.py.
+
+A matrix is invertible modulo m exactly when its determinant is coprime with
+m, i.e. when it is invertible modulo every prime factor p of m. That check
+only needs an elimination over the field GF(p), which stops at the first
+column without a pivot, so singular matrices are rejected before any work
+is done modulo m.
+
+Inversion and solving are done modulo each prime power p^e dividing m, where
+an element is invertible iff it is not a multiple of p (so a Gauss-Jordan
+pivot always exists for an invertible matrix), and the results are combined
+with the Chinese remainder theorem.
+
+Author: [Your Name]
+License: MIT
+"""
+
+import functools
+import math
+import operator
+import random
+import time
+
+
+@functools.lru_cache(maxsize=64)
+def facteurs_premiers(m):
+    """
+    Decompose m into prime powers.
+
+    Args:
+        m (int): Integer greater than 1
+
+    Returns:
+        tuple: Pairs (p, e) with m = product of p^e
+
+    Example:
+        >>> facteurs_premiers(27)
+        ((3, 3),)
+    """
+    facteurs = []
+    p = 2
+    while p * p <= m:
+        if m % p == 0:
+            e = 0
+            while m % p == 0:
+                m //= p
+                e += 1
+            facteurs.append((p, e))
+        p += 1
+    if m > 1:
+        facteurs.append((m, 1))
+    return tuple(facteurs)
+
+
+@functools.lru_cache(maxsize=64)
+def table_inverses(m):
+    """
+    Table of the modular inverses of every residue modulo m.
+
+    Args:
+        m (int): The modulus
+
+    Returns:
+        tuple: Element x is the inverse of x modulo m, or None if x is not a
+        unit (same convention as affine_cipher.table_inverses)
+
+    Example:
+        >>> table_inverses(27)[5]
+        11
+    """
+    return tuple(pow(x, -1, m) if math.gcd(x, m) == 1 else None for x in range(m))
+
+
+def multiplier(matrice_a, matrice_b, m):
+    """
+    Multiply two matrices modulo m.
+
+    Args:
+        matrice_a (list): Left matrix (p x q)
+        matrice_b (list): Right matrix (q x r)
+        m (int): The modulus
+
+    Returns:
+        list: Product matrix (p x r)
+    """
+    colonnes = list(zip(*matrice_b))
+    return [[sum(map(operator.mul, ligne, colonne)) % m for colonne in colonnes]
+            for ligne in matrice_a]
+
+
+def determinant(matrice, m=None):
+    """
+    Determinant using the fraction-free Bareiss algorithm.
+
+    All the intermediate values are integers (each division is exact), so the
+    exact determinant is obtained without fractions, then reduced modulo m.
+
+    Args:
+        matrice (list): Square matrix (2D list of integers)
+        m (int or None): Modulus to reduce the result, None for the exact value
+
+    Returns:
+        int: Determinant (modulo m if given)
+
+    Example:
+        >>> determinant([[3, 3], [2, 5]], 27)
+        9
+    """
+    n = len(matrice)
+    a = [ligne[:] for ligne in matrice]
+    signe = 1
+    precedent = 1
+
+    for k in range(n - 1):
+        if a[k][k] == 0:
+            pivot_row = next((row for row in range(k + 1, n) if a[row][k] != 0), -1)
+            if pivot_row == -1:
+                return 0
+            a[k], a[pivot_row] = a[pivot_row], a[k]
+            signe = -signe
+
+        pivot = a[k][k]
+        ligne_k = a[k]
+        for i in range(k + 1, n):
+            ligne_i = a[i]
+            facteur = ligne_i[k]
+            for j in range(k + 1, n):
+                ligne_i[j] = (pivot * ligne_i[j] - facteur * ligne_k[j]) // precedent
+        precedent = pivot
+
+    resultat = signe * a[n - 1][n - 1] if n > 0 else 1
+    return resultat % m if m is not None else resultat
+
+
+def rang(matrice, p):
+    """
+    Rank of a matrix over the field GF(p).
+
+    Args:
+        matrice (list): Matrix (2D list, not necessarily square)
+        p (int): Prime modulus
+
+    Returns:
+        int: Rank modulo p
+    """
+    inverses = table_inverses(p)
+    lignes = [[x % p for x in ligne] for ligne in matrice]
+    nb_colonnes = len(lignes[0]) if lignes else 0
+    r = 0
+
+    for col in range(nb_colonnes):
+        pivot_row = next((row for row in range(r, len(lignes)) if lignes[row][col]), -1)
+        if pivot_row == -1:
+            continue
+        lignes[r], lignes[pivot_row] = lignes[pivot_row], lignes[r]
+
+        inverse_pivot = inverses[lignes[r][col]]
+        ligne_pivot = [(x * inverse_pivot) % p for x in lignes[r]]
+        lignes[r] = ligne_pivot
+        for row in range(r + 1, len(lignes)):
+            facteur = lignes[row][col]
+            if facteur:
+                lignes[row] = [(x - facteur * y) % p for x, y in zip(lignes[row], ligne_pivot)]
+        r += 1
+
+    return r
+
+
+def _inversible_mod_premier(matrice, p):
+    """
+    Check det(matrice) != 0 over GF(p), stopping at the first missing pivot.
+    """
+    inverses = table_inverses(p)
+    n = len(matrice)
+    lignes = [[x % p for x in ligne] for ligne in matrice]
+
+    for col in range(n):
+        pivot_row = next((row for row in range(col, n) if lignes[row][col]), -1)
+        if pivot_row == -1:
+            return False
+        lignes[col], lignes[pivot_row] = lignes[pivot_row], lignes[col]
+
+        inverse_pivot = inverses[lignes[col][col]]
+        ligne_pivot = [(x * inverse_pivot) % p for x in lignes[col][col:]]
+        for row in range(col + 1, n):
+            facteur = lignes[row][col]
+            if facteur:
+                lignes[row][col:] = [(x - facteur * y) % p
+                                     for x, y in zip(lignes[row][col:], ligne_pivot)]
+
+    return True
+
+
+def est_inversible(matrice, m):
+    """
+    Check whether a square matrix is invertible modulo m.
+
+    The determinant must not share a factor with m, which is tested modulo
+    each prime factor of m (e.g. only modulo 3 for m = 27).
+
+    Args:
+        matrice (list): Square matrix
+        m (int): The modulus
+
+    Returns:
+        bool: True if the matrix is invertible modulo m
+    """
+    return all(_inversible_mod_premier(matrice, p) for p, _ in facteurs_premiers(m))
+
+
+def _gauss_jordan(matrice, second_membre, q):
+    """
+    Reduce [A | B] to [I | A^(-1).B] modulo a prime power q.
+
+    Returns None if A is not invertible modulo q.
+    """
+    inverses = table_inverses(q)
+    n = len(matrice)
+    augmentee = [[x % q for x in ligne] + [x % q for x in droite]
+                 for ligne, droite in zip(matrice, second_membre)]
+
+    for col in range(n):
+        # For a prime power, any unit pivot works and exists iff A is invertible
+        pivot_row = next((row for row in range(col, n)
+                          if inverses[augmentee[row][col]] is not None), -1)
+        if pivot_row == -1:
+            return None
+        augmentee[col], augmentee[pivot_row] = augmentee[pivot_row], augmentee[col]
+
+        # Columns before 'col' are already reduced and zero in the pivot row,
+        # so only the entries from 'col' onwards change
+        inverse_pivot = inverses[augmentee[col][col]]
+        ligne_pivot = [(x * inverse_pivot) % q for x in augmentee[col][col:]]
+        augmentee[col][col:] = ligne_pivot
+
+        for row in range(n):
+            ligne = augmentee[row]
+            facteur = ligne[col]
+            if row != col and facteur:
+                ligne[col:] = [(x - facteur * y) % q for x, y in zip(ligne[col:], ligne_pivot)]
+
+    return [ligne[n:] for ligne in augmentee]
+
+
+def _combiner_crt(resultats, m):
+    """
+    Combine matrices known modulo pairwise coprime q_i into a matrix modulo m.
+    """
+    if len(resultats) == 1:
+        return resultats[0][1]
+
+    lignes = len(resultats[0][1])
+    colonnes = len(resultats[0][1][0]) if lignes else 0
+    combinee = [[0] * colonnes for _ in range(lignes)]
+    for q, valeurs in resultats:
+        # Coefficient equal to 1 modulo q and to 0 modulo the other factors
+        cofacteur = m // q
+        coefficient = cofacteur * pow(cofacteur, -1, q)
+        for i in range(lignes):
+            ligne = combinee[i]
+            for j in range(colonnes):
+                ligne[j] += coefficient * valeurs[i][j]
+    return [[x % m for x in ligne] for ligne in combinee]
+
+
+def resoudre(matrice, second_membre, m):
+    """
+    Solve A.X = B modulo m for an invertible square matrix A.
+
+    Args:
+        matrice (list): Square matrix A (n x n)
+        second_membre (list): Right-hand side, a vector (n) or a matrix (n x k)
+        m (int): The modulus
+
+    Returns:
+        list or None: Solution X (same shape as B), None if A is not invertible
+    """
+    vecteur = bool(second_membre) and not isinstance(second_membre[0], (list, tuple))
+    droite = [[x] for x in second_membre] if vecteur else second_membre
+
+    if not est_inversible(matrice, m):
+        return None
+
+    resultats = []
+    for p, e in facteurs_premiers(m):
+        q = p ** e
+        resultats.append((q, _gauss_jordan(matrice, droite, q)))
+    solution = _combiner_crt(resultats, m)
+
+    return [ligne[0] for ligne in solution] if vecteur else solution
+
+
+def inverser(matrice, m):
+    """
+    Invert a square matrix modulo m.
+
+    Args:
+        matrice (list): Square matrix to invert (2D list)
+        m (int): The modulus
+
+    Returns:
+        list or None: Inverse matrix if it exists, None otherwise
+
+    Example:
+        >>> inverser([[3, 3], [2, 5]], 26)
+        [[15, 17], [20, 9]]
+    """
+    n = len(matrice)
+    identite = [[1 if i == j else 0 for j in range(n)] for i in range(n)]
+    return resoudre(matrice, identite, m)
+
+
+def benchmark_inversion(tailles=(2, 4, 8, 16, 32, 64, 128, 256, 512), taille_max_reference=256):
+    """
+    Compare `inverser` with hill_cipher.inverser_matrice_mod27.
+
+    Each size is measured on an invertible matrix and on a singular one (two
+    equal rows), where the modulo-3 pre-check rejects the matrix early.
+
+    Args:
+        tailles (tuple): Matrix sizes to measure
+        taille_max_reference (int): Largest size measured with the reference
+    """
+    from hill_cipher import generer_cle_inversible, inverser_matrice_mod27
+
+    def duree(fonction, *args):
+        debut = time.perf_counter()
+        fonction(*args)
+        return time.perf_counter() - debut
+
+    print(f"{'n':>5} | {'référence (s)':>14} | {'inverser (s)':>13} | "
+          f"{'singulière réf. (s)':>19} | {'singulière (s)':>14}")
+    print("-" * 79)
+    for n in tailles:
+        matrice, _ = generer_cle_inversible(n)
+        singuliere = [ligne[:] for ligne in matrice]
+        singuliere[-1] = singuliere[0][:]
+        random.shuffle(singuliere)
+
+        if n <= taille_max_reference:
+            reference = f"{duree(inverser_matrice_mod27, matrice):14.4f}"
+            reference_singuliere = f"{duree(inverser_matrice_mod27, singuliere):19.4f}"
+        else:
+            reference = f"{'ignoré':>14}"
+            reference_singuliere = f"{'ignoré':>19}"
+
+        rapide = duree(inverser, matrice, 27)
+        rapide_singuliere = duree(inverser, singuliere, 27)
+        print(f"{n:>5} | {reference} | {rapide:13.4f} | "
+              f"{reference_singuliere} | {rapide_singuliere:14.4f}")
@@ -0,0 +1,288 @@
+"""
+Analyse statistique du flot RC4
+===============================
+Mesure les biais connus du flot pseudo-aléatoire de RC4 sur un grand nombre
+de clés aléatoires :
+    - distribution des octets à chaque position du flot (par exemple le
+      deuxième octet vaut 0 avec une probabilité 2/256 au lieu de 1/256)
+    - fréquence des digrammes (couples d'octets consécutifs), où se trouvent
+      les biais de Fluhrer et McGrew
+
+Les clés sont réparties par lots dans un pool de processus. Dans chaque lot, les
+flots sont mis bout à bout dans un seul tampon : les octets d'une position sont
+une tranche à pas fixe du tampon, comptée par Counter (256 valeurs possibles), et
+les digrammes se lisent en entiers de 16 bits avec memoryview.cast('H'), comptés
+dans une liste de 65536 cases. Le comptage coûte alors environ le tiers de la
+génération des flots (KSA et PRGA), qui reste l'essentiel du temps de calcul.
+
+Les résultats sont enregistrés régulièrement dans un fichier JSON (écrit à côté
+puis renommé avec os.replace, donc jamais à moitié écrit) : une analyse
+interrompue reprend là où la dernière sauvegarde s'est arrêtée.
+
+Author: [Your Name]
+License: MIT
+"""
+
+import json
+import os
+import sys
+import time
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from rc4_cipher import gener_stream
+
+
+def _indice_digramme(code):
+    """Indice premier * 256 + second d'un digramme lu en 'H' (ordre natif)"""
+    if sys.byteorder == 'little':
+        return (code & 0xFF) << 8 | code >> 8
+    return code
+
+
+def _analyser_lot(nb_cles, longueur_cle, longueur_flot):
+    """
+    Worker : génère les flots de 'nb_cles' clés aléatoires et retourne
+    (comptes par position, comptes des digrammes).
+    """
+    cles = os.urandom(nb_cles * longueur_cle)
+    flots = bytearray().join(gener_stream(cles[k:k + longueur_cle], longueur_flot)
+                             for k in range(0, len(cles), longueur_cle))
+
+    # Octets de la position p de chaque flot : flots[p::longueur_flot]
+    positions = []
+    for p in range(longueur_flot):
+        comptes = [0] * 256
+        for octet, nombre in Counter(flots[p::longueur_flot]).items():
+            comptes[octet] = nombre
+        positions.append(comptes)
+
+    # Digrammes commençant à une position paire, puis impaire ; parmi ces derniers,
+    # ceux qui relient le dernier octet d'un flot au premier du suivant sont retirés.
+    # Avec 65536 valeurs possibles, une liste indexée par le code est environ
+    # cinq fois plus rapide qu'un Counter, mesuré sur des lots de 5000 clés
+    vue = memoryview(flots)
+    impairs = vue[1:-1].cast('H')
+    comptes = [0] * 65536
+    for code in vue.cast('H'):
+        comptes[code] += 1
+    for code in impairs:
+        comptes[code] += 1
+    for code in impairs[longueur_flot // 2 - 1::longueur_flot // 2]:
+        comptes[code] -= 1
+
+    # _indice_digramme est sa propre inverse
+    digrammes = [comptes[_indice_digramme(indice)] for indice in range(65536)]
+
+    return positions, digrammes
+
+
+def nouvelles_statistiques(longueur_cle=16, longueur_flot=256):
+    """Statistiques vides pour des clés et des flots de la longueur donnée"""
+    if longueur_flot < 2 or longueur_flot % 2:
+        raise ValueError("La longueur du flot doit être paire et au moins égale à 2")
+    return {
+        'longueur_cle': longueur_cle,
+        'longueur_flot': longueur_flot,
+        'nb_cles': 0,
+        'positions': [[0] * 256 for _ in range(longueur_flot)],
+        'digrammes': [0] * 65536,
+    }
+
+
+def fusionner_statistiques(statistiques, positions, digrammes, nb_cles):
+    """Ajoute les comptes d'un lot de 'nb_cles' clés aux statistiques"""
+    for total, comptes in zip(statistiques['positions'], positions):
+        total[:] = map(int.__add__, total, comptes)
+    statistiques['digrammes'][:] = map(int.__add__, statistiques['digrammes'], digrammes)
+    statistiques['nb_cles'] += nb_cles
+
+
+def enregistrer_statistiques(statistiques, fichier):
+    """Écrit les statistiques dans un fichier temporaire puis le renomme (atomique)"""
+    temporaire = fichier + '.tmp'
+    with open(temporaire, 'w') as f:
+        json.dump(statistiques, f, separators=(',', ':'))
+    os.replace(temporaire, fichier)
+
+
+def charger_statistiques(fichier):
+    with open(fichier) as f:
+        return json.load(f)
+
+
+def analyser_flots(nb_cles, longueur_flot=256, longueur_cle=16, fichier=None,
+                   processus=None, taille_lot=5000, intervalle_sauvegarde=30):
+    """
+    Accumule les statistiques du flot RC4 sur 'nb_cles' clés aléatoires.
+
+    nb_cles               : nombre total de clés à analyser (y compris celles d'une reprise)
+    longueur_flot         : nombre d'octets de flot analysés par clé (pair)
+    longueur_cle          : longueur des clés aléatoires, en octets
+    fichier               : fichier JSON de sauvegarde ; s'il existe, l'analyse reprend
+    processus             : nombre de processus (None : un par CPU, 1 : pas de pool)
+    taille_lot            : nombre de clés traitées par un processus à la fois
+    intervalle_sauvegarde : délai minimal en secondes entre deux sauvegardes
+
+    Retourne le dictionnaire des statistiques.
+    """
+    if fichier is not None and os.path.exists(fichier):
+        statistiques = charger_statistiques(fichier)
+        if (statistiques['longueur_cle'], statistiques['longueur_flot']) != (longueur_cle, longueur_flot):
+            raise ValueError(f"'{fichier}' a été produit avec des clés de {statistiques['longueur_cle']} "
+                             f"octets et des flots de {statistiques['longueur_flot']} octets")
+    else:
+        statistiques = nouvelles_statistiques(longueur_cle, longueur_flot)
+
+    reste = max(nb_cles - statistiques['nb_cles'], 0)
+    lots = [taille_lot] * (reste // taille_lot) + ([reste % taille_lot] if reste % taille_lot else [])
+    derniere_sauvegarde = time.monotonic()
+
+    def sauvegarder(force=False):
+        nonlocal derniere_sauvegarde
+        if fichier is not None and (force or time.monotonic() - derniere_sauvegarde >= intervalle_sauvegarde):
+            enregistrer_statistiques(statistiques, fichier)
+            derniere_sauvegarde = time.monotonic()
+
+    if processus == 1 or len(lots) <= 1:
+        try:
+            for taille in lots:
+                fusionner_statistiques(statistiques, *_analyser_lot(taille, longueur_cle, longueur_flot), taille)
+                sauvegarder()
+        finally:
+            sauvegarder(force=True)
+        return statistiques
+
+    # Au plus deux lots en attente par processus : une interruption ne perd
+    # que les lots en cours, et les résultats sont fusionnés au fil de l'eau
+    nb_processus = processus or os.cpu_count() or 1
+    executeur = ProcessPoolExecutor(max_workers=nb_processus)
+    en_attente = {}
+    try:
+        a_soumettre = iter(lots)
+        for taille in a_soumettre:
+            en_attente[executeur.submit(_analyser_lot, taille, longueur_cle, longueur_flot)] = taille
+            if len(en_attente) >= 2 * nb_processus:
+                break
+
+        while en_attente:
+            termines, _ = wait(en_attente, return_when=FIRST_COMPLETED)
+            for futur in termines:
+                fusionner_statistiques(statistiques, *futur.result(), en_attente.pop(futur))
+                taille = next(a_soumettre, None)
+                if taille is not None:
+                    en_attente[executeur.submit(_analyser_lot, taille, longueur_cle, longueur_flot)] = taille
+            sauvegarder()
+    finally:
+        executeur.shutdown(cancel_futures=True)
+        sauvegarder(force=True)
+
+    return statistiques
+
+
+def biais_positions(statistiques, nb=10):
+    """
+    Les 'nb' couples (position, octet) les plus éloignés de la loi uniforme.
+
+    Retourne une liste de (position, octet, rapport) triée par écart décroissant,
+    où rapport = probabilité observée * 256 (1.0 pour un octet uniforme) et où
+    les positions sont numérotées à partir de 1 comme dans la littérature.
+    """
+    nb_cles = statistiques['nb_cles']
+    if nb_cles == 0:
+        return []
+    rapports = ((position, octet, nombre * 256 / nb_cles)
+                for position, comptes in enumerate(statistiques['positions'], 1)
+                for octet, nombre in enumerate(comptes))
+    return sorted(rapports, key=lambda r: abs(r[2] - 1), reverse=True)[:nb]
+
+
+def biais_digrammes(statistiques, nb=10):
+    """
+    Les 'nb' digrammes les plus éloignés de la loi uniforme.
+
+    Retourne une liste de (premier octet, second octet, rapport) triée par écart
+    décroissant, où rapport = probabilité observée * 65536.
+    """
+    total = sum(statistiques['digrammes'])
+    if total == 0:
+        return []
+    rapports = ((indice >> 8, indice & 0xFF, nombre * 65536 / total)
+                for indice, nombre in enumerate(statistiques['digrammes']))
+    return sorted(rapports, key=lambda r: abs(r[2] - 1), reverse=True)[:nb]
+
+
+def afficher_rapport(statistiques, nb=10):
+    print(f"\n{statistiques['nb_cles']} clés de {statistiques['longueur_cle']} octets, "
+          f"flots de {statistiques['longueur_flot']} octets")
+
+    print(f"\n{'Position':>8} | {'Octet':>5} | {'P * 256':>8}")
+    print("-" * 28)
+    for position, octet, rapport in biais_positions(statistiques, nb):
+        print(f"{position:>8} | {octet:>5} | {rapport:8.4f}")
+
+    print(f"\n{'Digramme':>10} | {'P * 65536':>10}")
+    print("-" * 24)
+    for premier, second, rapport in biais_digrammes(statistiques, nb):
+        print(f"{f'({premier}, {second})':>10} | {rapport:10.4f}")
+
+
+def _analyser_reference(nb_cles, longueur_cle, longueur_flot):
+    """Comptage octet par octet, flot par flot (référence pour le benchmark)"""
+    positions = [[0] * 256 for _ in range(longueur_flot)]
+    digrammes = [0] * 65536
+    for _ in range(nb_cles):
+        flot = gener_stream(os.urandom(longueur_cle), longueur_flot)
+        for p, octet in enumerate(flot):
+            positions[p][octet] += 1
+        for premier, second in zip(flot, flot[1:]):
+            digrammes[premier << 8 | second] += 1
+    return positions, digrammes
+
+
+def benchmark_analyse(nb_cles=20_000, longueur_flot=256, longueur_cle=16, processus=None):
+    """Compare le nombre de clés analysées par seconde : comptage octet par octet / analyser_flots"""
+    print(f"{nb_cles} clés de {longueur_cle} octets, flots de {longueur_flot} octets")
+
+    debut = time.perf_counter()
+    _analyser_reference(nb_cles, longueur_cle, longueur_flot)
+    print(f"{'comptage octet par octet':<28}: {nb_cles / (time.perf_counter() - debut):10.0f} clés/s")
+
+    debut = time.perf_counter()
+    _analyser_lot(nb_cles, longueur_cle, longueur_flot)
+    print(f"{'comptage par lot':<28}: {nb_cles / (time.perf_counter() - debut):10.0f} clés/s")
+
+    debut = time.perf_counter()
+    analyser_flots(nb_cles, longueur_flot, longueur_cle, processus=processus)
+    print(f"{'analyser_flots':<28}: {nb_cles / (time.perf_counter() - debut):10.0f} clés/s")
+
+
+def main():
+    print("=" * 60)
+    print("     RC4 - ANALYSE DES BIAIS DU FLOT")
+    print("=" * 60)
+
+    try:
+        nb_cles = int(input("\nNombre de clés à analyser (ex: 1000000): "))
+        longueur_flot = int(input("Nombre d'octets de flot par clé (pair, ex: 256): ") or 256)
+    except ValueError:
+        print("⚠ Erreur: Veuillez entrer un nombre entier!")
+        return
+    fichier = input("Fichier de sauvegarde (Entrée pour aucun): ").strip() or None
+
+    debut = time.perf_counter()
+    try:
+        statistiques = analyser_flots(nb_cles, longueur_flot, fichier=fichier)
+    except ValueError as e:
+        print(f"⚠ Erreur: {e}")
+        return
+    except KeyboardInterrupt:
+        print("\n⚠ Analyse interrompue" + (f", reprise possible depuis '{fichier}'" if fichier else ""))
+        return
+    print(f"\n✓ Analyse terminée en {time.perf_counter() - debut:.1f} s")
+
+    afficher_rapport(statistiques)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,85 +1,571 @@
-def gener_stream(key, size):
-    # Phase 1: Key Schedule Algorithm
-    S = [i for i in range(256)]
+import asyncio
+import base64
+import mmap
+import os
+import struct
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+
+
+# Ordre de parcours de l'indice i pendant un tour complet : 1, 2, ..., 255, 0
+_ORDRE_I = list(range(1, 256)) + [0]
+
+
+def _ksa(key):
+    """Key Schedule Algorithm : retourne la permutation S initiale (liste de 256 entiers)"""
+    S = list(range(256))
     j = 0
     
-    longueur_cle = len(key)
-    
-    for i in range(256):
-        j = (j + S[i] + key[i % longueur_cle]) % 256
-        S[i], S[j] = S[j], S[i]
+    # Clé répétée sur 256 octets : évite un modulo par itération
+    cle_etendue = bytes(key) * (256 // len(key) + 1)
     
-    # Phase 2: Génération du flot pseudo-aléatoire
     i = 0
-    j = 0
-    flot = []
+    for octet_cle in cle_etendue[:256]:
+        si = S[i]
+        j = (j + si + octet_cle) & 0xFF
+        S[i] = S[j]
+        S[j] = si
+        i += 1
     
-    for _ in range(size):
-        i = (i + 1) % 256
-        j = (j + S[i]) % 256
-        S[i], S[j] = S[j], S[i]
-        octet_chiffrement = S[(S[i] + S[j]) % 256]
-        flot.append(octet_chiffrement)
+    return S
+
+
+def _prga(S, i, j, flot):
+    """
+    Remplit le bytearray 'flot' avec le flot pseudo-aléatoire
+    à partir de l'état (S, i, j), et retourne le nouvel état (i, j).
+    
+    Les indices i sont parcourus par tours de 256 sans calcul de modulo, et chaque
+    tour est écrit dans le tampon en une seule affectation de tranche.
+    """
+    taille = len(flot)
+    i_final = (i + taille) & 0xFF
+    tour = _ORDRE_I[i:] + _ORDRE_I[:i]
+    nb_tours, reste = divmod(taille, 256)
+    
+    k = 0
+    for indices in [tour] * nb_tours + [tour[:reste]]:
+        octets = []
+        ajouter = octets.append
+        for i in indices:
+            si = S[i]
+            j = (j + si) & 0xFF
+            sj = S[j]
+            S[i] = sj
+            S[j] = si
+            ajouter(S[(si + sj) & 0xFF])
+        flot[k:k + len(octets)] = octets
+        k += len(octets)
+    
+    return i_final, j
+
+
+def gener_stream(key, size):
+    # Phase 1: Key Schedule Algorithm
+    S = _ksa(key)
+    
+    # Phase 2: Génération du flot pseudo-aléatoire, écrit directement
+    # dans un bytearray préalloué
+    flot = bytearray(size)
+    _prga(S, 0, 0, flot)
     
     return flot
 
 
+def xor_octets(data, flot):
+    """XOR de deux suites d'octets de même longueur, en une seule opération sur des entiers"""
+    taille = len(data)
+    resultat = int.from_bytes(data, 'little') ^ int.from_bytes(flot, 'little')
+    return resultat.to_bytes(taille, 'little')
+
+
 def chiffrer(data, key):
-    if isinstance(data, bytes):
-        data = list(data)
+    if not isinstance(data, (bytes, bytearray, memoryview)):
+        data = bytes(data)
     
     flot = gener_stream(key, len(data))
     
-    resultat = []
-    for octet_message, octet_flot in zip(data, flot):
-        resultat.append(octet_message ^ octet_flot)
-    
-    return bytes(resultat)
+    return xor_octets(data, flot)
 
 
 def dechiffrer(data, key):
     return chiffrer(data, key)
 
 
-def chiffrer_message(message, key):
-    """Chiffre un message texte et retourne le résultat en hexadécimal"""
-    message_bytes = message.encode('utf-8')
-    chiffre = chiffrer(message_bytes, key)
-    return chiffre.hex()
+class RC4:
+    """
+    État RC4 persistant pour chiffrer un flux morceau par morceau.
+    
+    La permutation S est conservée dans un bytearray de 256 octets avec les indices
+    (i, j) : chaque appel à update() reprend le flot là où le précédent s'est arrêté,
+    et la mémoire utilisée ne dépend que de la taille des morceaux.
+    
+    key  : octets de la clé (bytes ou liste d'entiers entre 0 et 255)
+    drop : nombre d'octets de flot ignorés au départ (RC4-drop[n])
+    """
+    
+    TAILLE_ETAT = 258
+    
+    def __init__(self, key, drop=0):
+        self.S = bytearray(_ksa(key))
+        self.i = 0
+        self.j = 0
+        if drop:
+            self.skip(drop)
+    
+    def keystream(self, taille):
+        """Retourne les 'taille' prochains octets du flot pseudo-aléatoire"""
+        flot = bytearray(taille)
+        # Le PRGA travaille sur une liste (accès plus rapides), recopiée ensuite dans S
+        S = list(self.S)
+        self.i, self.j = _prga(S, self.i, self.j, flot)
+        self.S[:] = S
+        return flot
+    
+    def update(self, chunk):
+        """Chiffre (ou déchiffre) le morceau suivant du flux"""
+        return xor_octets(chunk, self.keystream(len(chunk)))
+    
+    def skip(self, taille, taille_bloc=1 << 16):
+        """Avance le flot de 'taille' octets sans les utiliser (par blocs de taille bornée)"""
+        while taille > 0:
+            n = min(taille, taille_bloc)
+            self.keystream(n)
+            taille -= n
+    
+    def snapshot(self):
+        """Sauvegarde l'état courant : S (256 octets) suivi de i et j"""
+        return bytes(self.S) + bytes([self.i, self.j])
+    
+    def restore(self, etat):
+        """Restaure un état produit par snapshot()"""
+        if len(etat) != self.TAILLE_ETAT:
+            raise ValueError(f"L'état RC4 doit faire {self.TAILLE_ETAT} octets")
+        self.S[:] = etat[:256]
+        self.i = etat[256]
+        self.j = etat[257]
+    
+    @classmethod
+    def from_snapshot(cls, etat):
+        """Crée un objet RC4 directement à partir d'un état sauvegardé"""
+        rc4 = cls.__new__(cls)
+        rc4.S = bytearray(256)
+        rc4.restore(etat)
+        return rc4
+
+
+class CacheRC4:
+    """
+    Cache LRU borné des états RC4 obtenus après le KSA, indexés par les octets de la clé.
+    
+    Pour une clé déjà vue, le KSA (256 étapes) n'est pas refait. Si longueur_prefixe > 0,
+    les premiers octets du flot sont aussi gardés : un message plus court que ce préfixe
+    ne coûte alors qu'un XOR. Les compteurs succes / echecs / evictions permettent de
+    surveiller l'efficacité du cache (voir stats()).
+    """
+    
+    def __init__(self, taille_max=128, longueur_prefixe=0):
+        if taille_max < 1:
+            raise ValueError("La taille du cache doit être au moins 1")
+        self.taille_max = taille_max
+        self.longueur_prefixe = longueur_prefixe
+        self.succes = 0
+        self.echecs = 0
+        self.evictions = 0
+        # clé -> (préfixe du flot, état RC4 après le préfixe)
+        self._entrees = OrderedDict()
+        self._verrou = threading.Lock()
+    
+    def _entree(self, key):
+        cle = bytes(key)
+        with self._verrou:
+            entree = self._entrees.get(cle)
+            if entree is not None:
+                self._entrees.move_to_end(cle)
+                self.succes += 1
+                return entree
+            self.echecs += 1
+        
+        rc4 = RC4(cle)
+        entree = (bytes(rc4.keystream(self.longueur_prefixe)), rc4.snapshot())
+        
+        with self._verrou:
+            self._entrees[cle] = entree
+            self._entrees.move_to_end(cle)
+            while len(self._entrees) > self.taille_max:
+                self._entrees.popitem(last=False)
+                self.evictions += 1
+        return entree
+    
+    def keystream(self, key, taille):
+        """Retourne les 'taille' premiers octets du flot de la clé"""
+        prefixe, etat = self._entree(key)
+        if taille <= len(prefixe):
+            return prefixe[:taille]
+        return prefixe + RC4.from_snapshot(etat).keystream(taille - len(prefixe))
+    
+    def chiffrer(self, data, key):
+        """Équivalent à chiffrer(data, key), sans refaire le KSA pour une clé en cache"""
+        return xor_octets(data, self.keystream(key, len(data)))
+    
+    def dechiffrer(self, data, key):
+        return self.chiffrer(data, key)
+    
+    def vider(self):
+        with self._verrou:
+            self._entrees.clear()
+    
+    def stats(self):
+        """Compteurs du cache, pour la supervision"""
+        with self._verrou:
+            total = self.succes + self.echecs
+            return {
+                'succes': self.succes,
+                'echecs': self.echecs,
+                'evictions': self.evictions,
+                'entrees': len(self._entrees),
+                'taux_succes': self.succes / total if total else 0.0,
+            }
+
+
+class ErreurDechiffrement(ValueError):
+    """Message chiffré illisible : encodage, trame ou texte UTF-8 invalide"""
+
+
+# Formats de transport des messages chiffrés. 'hex' est le format historique
+# (sans trame) ; les autres utilisent une trame : longueur sur 4 octets (big endian)
+# suivie du chiffré, transmise telle quelle ('binaire') ou encodée en base64 / base85.
+FORMATS = ('hex', 'binaire', 'base64', 'base85')
 
+_ENTETE_TRAME = struct.Struct('>I')
 
-def dechiffrer_message(message_hex, key):
-    """Déchiffre un message hexadécimal et retourne le texte"""
+
+def encoder_trame(chiffre, format='binaire'):
+    """Met un chiffré dans le format de transport demandé (str, ou bytes pour 'binaire')"""
+    if format == 'hex':
+        return bytes(chiffre).hex()
+    
+    trame = _ENTETE_TRAME.pack(len(chiffre)) + chiffre
+    if format == 'binaire':
+        return trame
+    if format == 'base64':
+        return base64.b64encode(trame).decode('ascii')
+    if format == 'base85':
+        return base64.b85encode(trame).decode('ascii')
+    raise ValueError(f"Format inconnu: {format!r} (formats possibles: {', '.join(FORMATS)})")
+
+
+def decoder_trame(donnees, format='binaire'):
+    """
+    Extrait le chiffré d'un message transporté dans le format donné.
+    
+    Pour le format 'binaire', le résultat est une memoryview sur 'donnees' (sans copie).
+    Lève ErreurDechiffrement si l'encodage ou la trame est invalide.
+    """
+    if format not in FORMATS:
+        raise ValueError(f"Format inconnu: {format!r} (formats possibles: {', '.join(FORMATS)})")
+    
     try:
-        chiffre = bytes.fromhex(message_hex)
+        if format == 'hex':
+            return memoryview(bytes.fromhex(donnees))
+        if format == 'binaire':
+            trame = memoryview(donnees)
+        elif format == 'base64':
+            trame = memoryview(base64.b64decode(donnees, validate=True))
+        else:
+            trame = memoryview(base64.b85decode(donnees))
+    except (ValueError, TypeError) as e:
+        raise ErreurDechiffrement(f"Encodage {format} invalide: {e}") from e
+    
+    if len(trame) < _ENTETE_TRAME.size:
+        raise ErreurDechiffrement("Trame trop courte")
+    (longueur,) = _ENTETE_TRAME.unpack_from(trame)
+    if len(trame) != _ENTETE_TRAME.size + longueur:
+        raise ErreurDechiffrement(
+            f"Longueur de trame incohérente: {longueur} annoncés, "
+            f"{len(trame) - _ENTETE_TRAME.size} reçus")
+    
+    return trame[_ENTETE_TRAME.size:]
+
+
+def chiffrer_message(message, key, cache=None, format='hex'):
+    """Chiffre un message texte et retourne le résultat dans le format de transport demandé
+    
+    cache  : CacheRC4 optionnel, pour ne pas refaire le KSA à chaque message
+    format : 'hex' (par défaut), 'binaire', 'base64' ou 'base85' (voir FORMATS)
+    """
+    message_bytes = message.encode('utf-8')
+    if cache is not None:
+        chiffre = cache.chiffrer(message_bytes, key)
+    else:
+        chiffre = chiffrer(message_bytes, key)
+    return encoder_trame(chiffre, format)
+
+
+def dechiffrer_message(message_chiffre, key, cache=None, format='hex'):
+    """Déchiffre un message dans le format de transport donné et retourne le texte
+    
+    Lève ErreurDechiffrement si le message ne peut pas être décodé.
+    """
+    chiffre = decoder_trame(message_chiffre, format)
+    if cache is not None:
+        dechiffre = cache.dechiffrer(chiffre, key)
+    else:
         dechiffre = dechiffrer(chiffre, key)
+    
+    try:
         return dechiffre.decode('utf-8')
-    except Exception as e:
-        return f"Erreur de déchiffrement: {e}"
+    except UnicodeDecodeError as e:
+        raise ErreurDechiffrement(f"Le texte déchiffré n'est pas de l'UTF-8 valide: {e}") from e
 
 
-def chiffrer_fichier(fichier_entree, fichier_sortie, key):
-    with open(fichier_entree, 'rb') as f:
-        contenu = f.read()
-    
-    chiffre = chiffrer(contenu, key)
+def benchmark_formats(tailles=(16, 256, 4096, 65536), repetitions=1000, key=b"Cle de test RC4!"):
+    """Compare, pour chaque format, la taille transmise et le temps d'encodage / décodage de la trame"""
+    print(f"{'Taille':>7} | {'Format':>8} | {'Octets transmis':>15} | {'Encodage (µs)':>13} | {'Décodage (µs)':>13}")
+    print("-" * 70)
+    for taille in tailles:
+        chiffre = chiffrer(os.urandom(taille), key)
+        for format in FORMATS:
+            debut = time.perf_counter()
+            for _ in range(repetitions):
+                trame = encoder_trame(chiffre, format)
+            duree_encodage = (time.perf_counter() - debut) / repetitions
+            
+            debut = time.perf_counter()
+            for _ in range(repetitions):
+                decoder_trame(trame, format)
+            duree_decodage = (time.perf_counter() - debut) / repetitions
+            
+            print(f"{taille:>7} | {format:>8} | {len(trame):>15} | "
+                  f"{duree_encodage * 1e6:13.2f} | {duree_decodage * 1e6:13.2f}")
+
+
+# Taille par défaut des blocs lus dans les fichiers (1 Mio)
+TAILLE_BLOC = 1 << 20
+
+
+def _traiter_fichier(fichier_entree, fichier_sortie, key, taille_bloc):
+    """Chiffre/déchiffre un fichier bloc par bloc : la mémoire utilisée ne dépend pas de sa taille"""
+    rc4 = RC4(key)
+    tampon = bytearray(taille_bloc)
+    vue = memoryview(tampon)
     
-    with open(fichier_sortie, 'wb') as f:
-        f.write(chiffre)
+    with open(fichier_entree, 'rb') as entree, open(fichier_sortie, 'wb') as sortie:
+        while True:
+            n = entree.readinto(tampon)
+            if not n:
+                break
+            sortie.write(rc4.update(vue[:n]))
+
+
+def chiffrer_fichier(fichier_entree, fichier_sortie, key, taille_bloc=TAILLE_BLOC):
+    _traiter_fichier(fichier_entree, fichier_sortie, key, taille_bloc)
     
     print(f"✓ Fichier chiffré: {fichier_entree} -> {fichier_sortie}")
 
 
-def dechiffrer_fichier(fichier_entree, fichier_sortie, key):
-    with open(fichier_entree, 'rb') as f:
-        contenu = f.read()
+def dechiffrer_fichier(fichier_entree, fichier_sortie, key, taille_bloc=TAILLE_BLOC):
+    _traiter_fichier(fichier_entree, fichier_sortie, key, taille_bloc)
+    
+    print(f"✓ Fichier déchiffré: {fichier_entree} -> {fichier_sortie}")
+
+
+def chiffrer_fichier_sur_place(fichier, key, taille_bloc=TAILLE_BLOC):
+    """Chiffre/déchiffre un fichier sur place via mmap, bloc par bloc (RC4 est symétrique)"""
+    rc4 = RC4(key)
     
-    dechiffre = dechiffrer(contenu, key)
+    with open(fichier, 'r+b') as f:
+        taille = os.fstat(f.fileno()).st_size
+        if taille == 0:
+            return
+        
+        with mmap.mmap(f.fileno(), 0) as carte:
+            for debut in range(0, taille, taille_bloc):
+                fin = min(debut + taille_bloc, taille)
+                carte[debut:fin] = rc4.update(carte[debut:fin])
+            carte.flush()
+
+
+def _chiffrer_enregistrements(enregistrements):
+    """Worker : chiffre une liste de couples (data, key)"""
+    return [chiffrer(data, key) for data, key in enregistrements]
+
+
+def chiffrer_lot(enregistrements, processus=None, taille_morceau=2000):
+    """
+    Chiffre (ou déchiffre) de nombreux enregistrements, chacun avec sa propre clé.
     
-    with open(fichier_sortie, 'wb') as f:
-        f.write(dechiffre)
+    enregistrements : itérable de couples (data, key)
+    processus       : nombre de processus (None : un par CPU, 1 : pas de pool)
+    taille_morceau  : nombre d'enregistrements envoyés à la fois à un processus
     
-    print(f"✓ Fichier déchiffré: {fichier_entree} -> {fichier_sortie}")
+    Retourne la liste des résultats dans l'ordre des enregistrements.
+    """
+    morceaux = []
+    morceau = []
+    for data, key in enregistrements:
+        morceau.append((data, key))
+        if len(morceau) == taille_morceau:
+            morceaux.append(morceau)
+            morceau = []
+    if morceau:
+        morceaux.append(morceau)
+    
+    if processus == 1 or len(morceaux) <= 1:
+        resultats = map(_chiffrer_enregistrements, morceaux)
+    else:
+        with ProcessPoolExecutor(max_workers=processus) as executeur:
+            resultats = list(executeur.map(_chiffrer_enregistrements, morceaux))
+    
+    return [chiffre for morceau in resultats for chiffre in morceau]
+
+
+def dechiffrer_lot(enregistrements, processus=None, taille_morceau=2000):
+    return chiffrer_lot(enregistrements, processus, taille_morceau)
+
+
+def benchmark_lot(nb_enregistrements=100_000, taille=64, taille_cle=16, processus=None):
+    """Compare le nombre d'enregistrements chiffrés par seconde : boucle sur chiffrer / chiffrer_lot"""
+    enregistrements = [(os.urandom(taille), os.urandom(taille_cle)) for _ in range(nb_enregistrements)]
+    
+    print(f"{nb_enregistrements} enregistrements de {taille} octets, clés de {taille_cle} octets")
+    
+    debut = time.perf_counter()
+    reference = [_chiffrer_reference(data, key) for data, key in enregistrements]
+    print(f"{'ancienne implémentation':<28}: {nb_enregistrements / (time.perf_counter() - debut):10.0f} enr./s")
+    
+    debut = time.perf_counter()
+    boucle = [chiffrer(data, key) for data, key in enregistrements]
+    print(f"{'boucle sur chiffrer':<28}: {nb_enregistrements / (time.perf_counter() - debut):10.0f} enr./s")
+    
+    debut = time.perf_counter()
+    lot = chiffrer_lot(enregistrements, processus=processus)
+    print(f"{'chiffrer_lot':<28}: {nb_enregistrements / (time.perf_counter() - debut):10.0f} enr./s")
+    
+    assert reference == boucle == lot
+
+
+async def chiffrer_flux_async(reader, writer, key, taille_morceau=1 << 16, drop=0, latences=None):
+    """
+    Chiffre (ou déchiffre) tout ce qui arrive sur un asyncio.StreamReader et l'écrit
+    sur un asyncio.StreamWriter, morceau par morceau, avec un état RC4 persistant.
+    
+    Chaque écriture est suivie de drain() : si le destinataire lit moins vite, la
+    lecture est suspendue (contre-pression) et la mémoire reste bornée.
+    Si 'latences' est une liste, la durée de traitement de chaque morceau y est ajoutée.
+    
+    Retourne le nombre d'octets traités.
+    """
+    rc4 = RC4(key, drop)
+    total = 0
+    
+    while True:
+        morceau = await reader.read(taille_morceau)
+        if not morceau:
+            break
+        
+        debut = time.perf_counter()
+        writer.write(rc4.update(morceau))
+        await writer.drain()
+        if latences is not None:
+            latences.append(time.perf_counter() - debut)
+        total += len(morceau)
+    
+    return total
+
+
+async def _benchmark_async(connexions, taille, taille_morceau, key):
+    latences = []
+    
+    async def gerer_connexion(reader, writer):
+        await chiffrer_flux_async(reader, writer, key, taille_morceau, latences=latences)
+        writer.close()
+        await writer.wait_closed()
+    
+    serveur = await asyncio.start_server(gerer_connexion, '127.0.0.1', 0)
+    port = serveur.sockets[0].getsockname()[1]
+    
+    donnees = os.urandom(taille)
+    attendu = chiffrer(donnees, key)
+    
+    async def client():
+        reader, writer = await asyncio.open_connection('127.0.0.1', port)
+        
+        async def envoyer():
+            for debut in range(0, taille, taille_morceau):
+                writer.write(donnees[debut:debut + taille_morceau])
+                await writer.drain()
+            writer.write_eof()
+        
+        envoi = asyncio.create_task(envoyer())
+        recu = await reader.read()
+        await envoi
+        writer.close()
+        await writer.wait_closed()
+        return recu == attendu
+    
+    debut = time.perf_counter()
+    resultats = await asyncio.gather(*(client() for _ in range(connexions)))
+    duree = time.perf_counter() - debut
+    
+    serveur.close()
+    await serveur.wait_closed()
+    
+    latences.sort()
+    total = connexions * taille
+    print(f"{connexions} connexions x {taille} octets (morceaux de {taille_morceau} octets)")
+    print(f"Débit total        : {total / duree / 1e6:.2f} Mo/s")
+    if latences:
+        print(f"Latence par morceau: médiane {latences[len(latences) // 2] * 1e3:.2f} ms, "
+              f"p99 {latences[int(len(latences) * 0.99)] * 1e3:.2f} ms, "
+              f"max {latences[-1] * 1e3:.2f} ms")
+    print(f"Flux corrects      : {sum(resultats)}/{connexions}")
+
+
+def benchmark_async(connexions=100, taille=1 << 20, taille_morceau=1 << 16, key=b"Cle de test RC4!"):
+    """Mesure débit et latence de chiffrer_flux_async sur des connexions locales simultanées"""
+    asyncio.run(_benchmark_async(connexions, taille, taille_morceau, key))
+
+
+def _chiffrer_reference(data, key):
+    """Ancienne implémentation (listes Python), conservée pour le benchmark"""
+    S = [i for i in range(256)]
+    j = 0
+    for i in range(256):
+        j = (j + S[i] + key[i % len(key)]) % 256
+        S[i], S[j] = S[j], S[i]
+    
+    i = 0
+    j = 0
+    flot = []
+    for _ in range(len(data)):
+        i = (i + 1) % 256
+        j = (j + S[i]) % 256
+        S[i], S[j] = S[j], S[i]
+        flot.append(S[(S[i] + S[j]) % 256])
+    
+    return bytes([octet_message ^ octet_flot for octet_message, octet_flot in zip(list(data), flot)])
+
+
+def benchmark_rc4(tailles=(1_000, 1_000_000, 10_000_000), key=b"Cle de test RC4!"):
+    """Compare le débit (Mo/s) de l'ancienne implémentation et de chiffrer"""
+    print(f"{'Taille':>12} | {'avant (Mo/s)':>13} | {'après (Mo/s)':>13}")
+    print("-" * 44)
+    for taille in tailles:
+        data = os.urandom(taille)
+        
+        debut = time.perf_counter()
+        reference = _chiffrer_reference(data, key)
+        duree_avant = time.perf_counter() - debut
+        
+        debut = time.perf_counter()
+        resultat = chiffrer(data, key)
+        duree_apres = time.perf_counter() - debut
+        
+        assert resultat == reference
+        print(f"{taille:>12} | {taille / duree_avant / 1e6:13.2f} | {taille / duree_apres / 1e6:13.2f}")
 
 
 def saisir_cle():
@@ -137,7 +623,7 @@ def generer_et_afficher_flot(key):
     print(f"\nHexadécimal:")
     print(f"  {bytes(flot).hex()}")
     print(f"\nPremiers octets (max 20):")
-    print(f"  {flot[:min(20, len(flot))]}")
+    print(f"  {list(flot[:min(20, len(flot))])}")
 
 
 def menu_message(key):
@@ -162,7 +648,11 @@ def menu_message(key):
         elif choix == "2":
             print("\n--- Déchiffrement de message ---")
             message_hex = input("Entrez le message chiffré (hexadécimal): ").strip()
-            dechiffre = dechiffrer_message(message_hex, key)
+            try:
+                dechiffre = dechiffrer_message(message_hex, key)
+            except ErreurDechiffrement as e:
+                print(f"⚠ Erreur de déchiffrement: {e}")
+                continue
             print(f"\n✓ Message déchiffré:")
             print(f"  {dechiffre}")
         
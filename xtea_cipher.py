@@ -1,4 +1,8 @@
+import os
 import struct
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
 
 DELTA = 0x9E3779B9
 ROUNDS = 32
@@ -11,9 +15,9 @@ def xtea_encrypt_block(block, key):
     k = struct.unpack(">4I", key)
     s = 0
     for _ in range(ROUNDS):
+        v0 = to_u32(v0 + ((((v1 << 4) ^ (v1 >> 5)) + v1) ^ (s + k[s & 3])))
         s = to_u32(s + DELTA)
-        v0 = to_u32(v0 + (((v1 << 4) ^ (v1 >> 5)) + v1) ^ (s + k[s & 3]))
-        v1 = to_u32(v1 + (((v0 << 4) ^ (v0 >> 5)) + v0) ^ (s + k[(s >> 11) & 3]))
+        v1 = to_u32(v1 + ((((v0 << 4) ^ (v0 >> 5)) + v0) ^ (s + k[(s >> 11) & 3])))
     return struct.pack(">2I", v0, v1)
 
 def xtea_decrypt_block(block, key):
@@ -21,74 +25,648 @@ def xtea_decrypt_block(block, key):
     k = struct.unpack(">4I", key)
     s = (DELTA * ROUNDS) & 0xffffffff
     for _ in range(ROUNDS):
-        v1 = to_u32(v1 - (((v0 << 4) ^ (v0 >> 5)) + v0) ^ (s + k[(s >> 11) & 3]))
-        v0 = to_u32(v0 - (((v1 << 4) ^ (v1 >> 5)) + v1) ^ (s + k[s & 3]))
+        v1 = to_u32(v1 - ((((v0 << 4) ^ (v0 >> 5)) + v0) ^ (s + k[(s >> 11) & 3])))
         s = to_u32(s - DELTA)
+        v0 = to_u32(v0 - ((((v1 << 4) ^ (v1 >> 5)) + v1) ^ (s + k[s & 3])))
     return struct.pack(">2I", v0, v1)
 
+# ---------------- COMPILED KEY ----------------
+
+BLOCK = struct.Struct(">2I")
+
+# Blocks handled together by the lane engine: 4096 blocks = 32 KB per pass
+LANE_BLOCKS = 4096
+# Below this many blocks the per-block loop is used
+LANE_MIN_BLOCKS = 3
+# Modes work through their input in segments of this many bytes
+SEGMENT = 8 * LANE_BLOCKS
+
+def _to_lanes(data, start, n):
+    # v0 and v1 of every block as the 64-bit lanes of two integers
+    # (big-endian word in the low 32 bits of each lane)
+    v0 = bytearray(8 * n)
+    v1 = bytearray(8 * n)
+    end = start + 8 * n
+    for j in range(4):
+        v0[4 + j::8] = data[start + j:end:8]
+        v1[4 + j::8] = data[start + 4 + j:end:8]
+    return int.from_bytes(v0, "big"), int.from_bytes(v1, "big")
+
+def _from_lanes(v0, v1, n, out, offset):
+    a = v0.to_bytes(8 * n, "big")
+    b = v1.to_bytes(8 * n, "big")
+    end = offset + 8 * n
+    for j in range(4):
+        out[offset + j:end:8] = a[4 + j::8]
+        out[offset + 4 + j:end:8] = b[4 + j::8]
+
+class XTEA:
+    block_size = 8
+
+    def __init__(self, key):
+        if len(key) != 16:
+            raise ValueError("XTEA key must be 16 bytes")
+        k = struct.unpack(">4I", key)
+        # Unpack the key once and keep the 64 values of s + k[...], two per round
+        round_keys = []
+        s = 0
+        for _ in range(ROUNDS):
+            k0 = to_u32(s + k[s & 3])
+            s = to_u32(s + DELTA)
+            round_keys.append((k0, to_u32(s + k[(s >> 11) & 3])))
+        self.round_keys = tuple(round_keys)
+        self.round_keys_reversed = tuple(reversed(round_keys))
+        self._lanes = {}
+
+    @classmethod
+    def new(cls, key, mode, iv=None, decrypt=False):
+        return XTEAStream(cls(key), mode, iv, decrypt)
+
+    def encrypt_block(self, block):
+        out = bytearray(8)
+        self._encrypt_scalar(block, out, 0)
+        return bytes(out)
+
+    def decrypt_block(self, block):
+        out = bytearray(8)
+        self._decrypt_scalar(block, out, 0)
+        return bytes(out)
+
+    def encrypt_blocks(self, data):
+        out = bytearray(len(data))
+        self.encrypt_blocks_into(data, out)
+        return bytes(out)
+
+    def decrypt_blocks(self, data):
+        out = bytearray(len(data))
+        self.decrypt_blocks_into(data, out)
+        return bytes(out)
+
+    def encrypt_blocks_into(self, data, out, offset=0):
+        self._process_into(data, out, offset, self._encrypt_scalar, self._encrypt_lanes)
+
+    def decrypt_blocks_into(self, data, out, offset=0):
+        self._process_into(data, out, offset, self._decrypt_scalar, self._decrypt_lanes)
+
+    def _process_into(self, data, out, offset, scalar, lanes):
+        if len(data) % 8:
+            raise ValueError("data length must be a multiple of 8")
+        count = len(data) // 8
+        if count < LANE_MIN_BLOCKS:
+            scalar(data, out, offset)
+            return
+        for start in range(0, count, LANE_BLOCKS):
+            n = min(LANE_BLOCKS, count - start)
+            lanes(data, 8 * start, n, out, offset + 8 * start)
+
+    def _encrypt_scalar(self, data, out, offset):
+        round_keys = self.round_keys
+        pack_into = BLOCK.pack_into
+        for v0, v1 in BLOCK.iter_unpack(data):
+            for k0, k1 in round_keys:
+                v0 = (v0 + ((((v1 << 4) ^ (v1 >> 5)) + v1) ^ k0)) & 0xffffffff
+                v1 = (v1 + ((((v0 << 4) ^ (v0 >> 5)) + v0) ^ k1)) & 0xffffffff
+            pack_into(out, offset, v0, v1)
+            offset += 8
+
+    def _decrypt_scalar(self, data, out, offset):
+        round_keys = self.round_keys_reversed
+        pack_into = BLOCK.pack_into
+        for v0, v1 in BLOCK.iter_unpack(data):
+            for k0, k1 in round_keys:
+                v1 = (v1 - ((((v0 << 4) ^ (v0 >> 5)) + v0) ^ k1)) & 0xffffffff
+                v0 = (v0 - ((((v1 << 4) ^ (v1 >> 5)) + v1) ^ k0)) & 0xffffffff
+            pack_into(out, offset, v0, v1)
+            offset += 8
+
+    # Chained modes: the state is the previous block as two words
+
+    def _cbc_encrypt(self, data, out, offset, prev):
+        round_keys = self.round_keys
+        pack_into = BLOCK.pack_into
+        p0, p1 = prev
+        for v0, v1 in BLOCK.iter_unpack(data):
+            v0 ^= p0
+            v1 ^= p1
+            for k0, k1 in round_keys:
+                v0 = (v0 + ((((v1 << 4) ^ (v1 >> 5)) + v1) ^ k0)) & 0xffffffff
+                v1 = (v1 + ((((v0 << 4) ^ (v0 >> 5)) + v0) ^ k1)) & 0xffffffff
+            pack_into(out, offset, v0, v1)
+            offset += 8
+            p0, p1 = v0, v1
+        return p0, p1
+
+    def _ofb_keystream(self, out, n, feedback):
+        round_keys = self.round_keys
+        pack_into = BLOCK.pack_into
+        v0, v1 = feedback
+        for offset in range(0, 8 * n, 8):
+            for k0, k1 in round_keys:
+                v0 = (v0 + ((((v1 << 4) ^ (v1 >> 5)) + v1) ^ k0)) & 0xffffffff
+                v1 = (v1 + ((((v0 << 4) ^ (v0 >> 5)) + v0) ^ k1)) & 0xffffffff
+            pack_into(out, offset, v0, v1)
+        return v0, v1
+
+    # CBC decryption only chains through the ciphertext, so whole segments go
+    # through the lane engine and are then XORed with the shifted ciphertext.
+    # The chaining blocks are copied first, which allows out to be data itself.
+    def _cbc_decrypt(self, data, out, offset, prev):
+        data = memoryview(data)
+        for start in range(0, len(data), SEGMENT):
+            segment = data[start:start + SEGMENT]
+            n = len(segment)
+            chain = prev + bytes(segment[:n - 8])
+            prev = bytes(segment[n - 8:])
+            self.decrypt_blocks_into(segment, out, offset + start)
+            _xor_into(memoryview(out)[offset + start:offset + start + n], chain, out, offset + start)
+        return prev
+
+    def _ctr_process(self, data, out, offset, counter):
+        data = memoryview(data)
+        for start in range(0, len(data), SEGMENT):
+            segment = data[start:start + SEGMENT]
+            n = (len(segment) + 7) // 8
+            _xor_into(segment, ctr_keystream(self, counter, n), out, offset + start)
+            counter += n
+        return counter
+
+    def _lane_constants(self, n):
+        # Mask and round keys repeated in every lane, kept for the full lane width
+        constants = self._lanes.get(n)
+        if constants is None:
+            ones = int.from_bytes(b"\0\0\0\0\0\0\0\1" * n, "big")
+            round_keys = tuple((k0 * ones, k1 * ones) for k0, k1 in self.round_keys)
+            constants = (0xffffffff * ones, round_keys, round_keys[::-1])
+            if n == LANE_BLOCKS:
+                self._lanes[n] = constants
+        return constants
+
+    # Every block at once: the 32-bit words sit in 64-bit lanes, so << 4 and
+    # the additions stay inside their lane, and the bits that >> 5 brings down
+    # from the next lane land in bits 59-63, far above any carry, until the mask
+    def _encrypt_lanes(self, data, start, n, out, offset):
+        mask, round_keys, _ = self._lane_constants(n)
+        v0, v1 = _to_lanes(data, start, n)
+        for k0, k1 in round_keys:
+            v0 = (v0 + ((((v1 << 4) ^ (v1 >> 5)) + v1) ^ k0)) & mask
+            v1 = (v1 + ((((v0 << 4) ^ (v0 >> 5)) + v0) ^ k1)) & mask
+        _from_lanes(v0, v1, n, out, offset)
+
+    # Subtraction borrows across lanes: the subtrahend is masked first and
+    # 2^32 is added to every lane so that each difference stays positive
+    def _decrypt_lanes(self, data, start, n, out, offset):
+        mask, _, round_keys = self._lane_constants(n)
+        bias = mask + mask // 0xffffffff
+        v0, v1 = _to_lanes(data, start, n)
+        for k0, k1 in round_keys:
+            v1 = (v1 + bias - (((((v0 << 4) ^ (v0 >> 5)) + v0) ^ k1) & mask)) & mask
+            v0 = (v0 + bias - (((((v1 << 4) ^ (v1 >> 5)) + v1) ^ k0) & mask)) & mask
+        _from_lanes(v0, v1, n, out, offset)
+
 def pad(b):
     p = 8 - (len(b) % 8)
     return b + bytes([p]) * p
 
+def unpadded_length(b, n):
+    # Length of b[:n] once its padding is removed
+    p = b[n - 1] if n else 0
+    if not 1 <= p <= 8 or p > n:
+        raise ValueError("invalid padding")
+    return n - p
+
 def unpad(b):
-    return b[:-b[-1]]
+    return b[:unpadded_length(b, len(b))]
+
+def padded_size(n):
+    return n + 8 - n % 8
+
+def _pad_tail(msg, full):
+    # Last padded block only, instead of a padded copy of the whole message
+    tail = bytes(msg[full:])
+    p = 8 - len(tail)
+    return tail + bytes([p]) * p
+
+def _check_out(out, n):
+    if len(out) < n:
+        raise ValueError(f"output buffer too small ({len(out)} < {n} bytes)")
+
+def _xor_into(a, b, out, offset):
+    n = len(a)
+    x = int.from_bytes(a, "little") ^ int.from_bytes(memoryview(b)[:n], "little")
+    out[offset:offset + n] = x.to_bytes(n, "little")
 
 # ---------------- MODES ----------------
 
+# The *_into functions write into a caller-supplied writable buffer (bytearray,
+# memoryview, mmap...) and return the number of bytes of output
+
+def ecb_encrypt_into(msg, key, out):
+    full = len(msg) - len(msg) % 8
+    _check_out(out, full + 8)
+    cipher = XTEA(key)
+    cipher.encrypt_blocks_into(memoryview(msg)[:full], out)
+    cipher.encrypt_blocks_into(_pad_tail(msg, full), out, full)
+    return full + 8
+
+def ecb_decrypt_into(ct, key, out):
+    _check_out(out, len(ct))
+    XTEA(key).decrypt_blocks_into(ct, out)
+    return unpadded_length(out, len(ct))
+
+def cbc_encrypt_into(msg, key, iv, out):
+    full = len(msg) - len(msg) % 8
+    _check_out(out, full + 8)
+    cipher = XTEA(key)
+    prev = cipher._cbc_encrypt(memoryview(msg)[:full], out, 0, BLOCK.unpack(iv))
+    cipher._cbc_encrypt(_pad_tail(msg, full), out, full, prev)
+    return full + 8
+
+def cbc_decrypt_into(ct, key, iv, out):
+    _check_out(out, len(ct))
+    XTEA(key)._cbc_decrypt(ct, out, 0, bytes(iv))
+    return unpadded_length(out, len(ct))
+
+def ofb_process_into(data, key, iv, out):
+    _check_out(out, len(data))
+    cipher = XTEA(key)
+    data = memoryview(data)
+    feedback = BLOCK.unpack(iv)
+    stream = bytearray(SEGMENT)
+    for start in range(0, len(data), SEGMENT):
+        segment = data[start:start + SEGMENT]
+        feedback = cipher._ofb_keystream(stream, (len(segment) + 7) // 8, feedback)
+        _xor_into(segment, stream, out, start)
+    return len(data)
+
+def ctr_keystream(cipher, counter, n):
+    # n counter blocks, wrapping at 2^64, encrypted in one pass
+    counters = range(counter, counter + n)
+    if counter + n > 1 << 64:
+        counters = [c & 0xffffffffffffffff for c in counters]
+    return cipher.encrypt_blocks(struct.pack(f">{n}Q", *counters))
+
+def ctr_process_into(data, key, iv, out):
+    _check_out(out, len(data))
+    XTEA(key)._ctr_process(data, out, 0, int.from_bytes(iv, "big"))
+    return len(data)
+
 def ecb_encrypt(msg, key):
-    msg = pad(msg)
-    out = b""
-    for i in range(0, len(msg), 8):
-        out += xtea_encrypt_block(msg[i:i+8], key)
-    return out
+    out = bytearray(padded_size(len(msg)))
+    ecb_encrypt_into(msg, key, out)
+    return bytes(out)
 
 def ecb_decrypt(ct, key):
-    out = b""
-    for i in range(0, len(ct), 8):
-        out += xtea_decrypt_block(ct[i:i+8], key)
-    return unpad(out)
+    out = bytearray(len(ct))
+    del out[ecb_decrypt_into(ct, key, out):]
+    return bytes(out)
 
 def cbc_encrypt(msg, key, iv):
-    msg = pad(msg)
-    out = b""
-    prev = iv
-    for i in range(0, len(msg), 8):
-        block = bytes(a ^ b for a, b in zip(msg[i:i+8], prev))
-        enc = xtea_encrypt_block(block, key)
-        out += enc
-        prev = enc
-    return out
+    out = bytearray(padded_size(len(msg)))
+    cbc_encrypt_into(msg, key, iv, out)
+    return bytes(out)
 
 def cbc_decrypt(ct, key, iv):
-    out = b""
-    prev = iv
-    for i in range(0, len(ct), 8):
-        dec = xtea_decrypt_block(ct[i:i+8], key)
-        block = bytes(a ^ b for a, b in zip(dec, prev))
-        out += block
-        prev = ct[i:i+8]
-    return unpad(out)
+    out = bytearray(len(ct))
+    del out[cbc_decrypt_into(ct, key, iv, out):]
+    return bytes(out)
 
 def ofb_process(data, key, iv):
-    out = b""
-    feedback = iv
-    for i in range(0, len(data), 8):
-        stream = xtea_encrypt_block(feedback, key)
-        chunk = data[i:i+8]
-        out += bytes(a ^ b for a, b in zip(chunk, stream[:len(chunk)]))
-        feedback = stream
-    return out
+    out = bytearray(len(data))
+    ofb_process_into(data, key, iv, out)
+    return bytes(out)
 
 def ctr_process(data, key, iv):
+    out = bytearray(len(data))
+    ctr_process_into(data, key, iv, out)
+    return bytes(out)
+
+# ---------------- STREAMING ----------------
+
+MODES = ("ECB", "CBC", "OFB", "CTR")
+
+class XTEAStream:
+    # Incremental encryption or decryption: update() takes chunks of any size
+    # and returns the output available so far, finalize() the rest. Between
+    # calls only the partial block and the chaining state are kept.
+
+    def __init__(self, cipher, mode, iv=None, decrypt=False):
+        mode = mode.upper()
+        if mode not in MODES:
+            raise ValueError(f"unknown mode {mode!r} (expected one of {', '.join(MODES)})")
+        if mode != "ECB" and (iv is None or len(iv) != 8):
+            raise ValueError(f"{mode} needs an 8-byte IV")
+        self.cipher = cipher
+        self.mode = mode
+        self.decrypt = decrypt
+        self._residue = b""
+        self._finalized = False
+        if mode == "CBC":
+            self._prev = bytes(iv) if decrypt else BLOCK.unpack(iv)
+        elif mode == "OFB":
+            self._feedback = BLOCK.unpack(iv)
+        elif mode == "CTR":
+            self._counter = int.from_bytes(iv, "big")
+
+    def update(self, chunk):
+        if self._finalized:
+            raise ValueError("finalize() has already been called")
+        chunk = memoryview(chunk)
+        if self.mode in ("OFB", "CTR"):
+            return self._update_stream(chunk)
+
+        # Decryption holds back the last full block: it carries the padding
+        residue = self._residue
+        total = len(residue) + len(chunk)
+        keep = total % 8
+        if self.decrypt and keep == 0 and total:
+            keep = 8
+        if total - keep == 0:
+            self._residue = residue + bytes(chunk)
+            return b""
+
+        out = bytearray(total - keep)
+        offset = 0
+        if residue:
+            offset = 8 - len(residue)
+            self._process_blocks(residue + bytes(chunk[:offset]), out, 0)
+        self._process_blocks(chunk[offset:len(chunk) - keep], out, 8 if residue else 0)
+        self._residue = bytes(chunk[len(chunk) - keep:])
+        return bytes(out)
+
+    def finalize(self):
+        if self._finalized:
+            raise ValueError("finalize() has already been called")
+        self._finalized = True
+        if self.mode in ("OFB", "CTR"):
+            return b""
+
+        out = bytearray(8)
+        if not self.decrypt:
+            self._process_blocks(_pad_tail(self._residue, 0), out, 0)
+            return bytes(out)
+        if len(self._residue) != 8:
+            raise ValueError("ciphertext length must be a non-zero multiple of 8")
+        self._process_blocks(self._residue, out, 0)
+        return unpad(bytes(out))
+
+    def _process_blocks(self, data, out, offset):
+        cipher = self.cipher
+        if self.mode == "ECB":
+            if self.decrypt:
+                cipher.decrypt_blocks_into(data, out, offset)
+            else:
+                cipher.encrypt_blocks_into(data, out, offset)
+        elif self.decrypt:
+            self._prev = cipher._cbc_decrypt(data, out, offset, self._prev)
+        else:
+            self._prev = cipher._cbc_encrypt(data, out, offset, self._prev)
+
+    def _update_stream(self, chunk):
+        # Keystream left over from the previous partial block is used first
+        out = bytearray(len(chunk))
+        used = min(len(self._residue), len(chunk))
+        if used:
+            _xor_into(chunk[:used], self._residue, out, 0)
+            self._residue = self._residue[used:]
+
+        rest = chunk[used:]
+        n = (len(rest) + 7) // 8
+        if n:
+            if self.mode == "OFB":
+                stream = bytearray(8 * n)
+                self._feedback = self.cipher._ofb_keystream(stream, n, self._feedback)
+            else:
+                stream = ctr_keystream(self.cipher, self._counter, n)
+                self._counter += n
+            _xor_into(rest, stream, out, used)
+            self._residue = bytes(stream[len(rest):])
+        return bytes(out)
+
+def _process_file(src_path, dst_path, stream, chunk_size):
+    # One reusable read buffer: memory does not depend on the file size
+    buffer = bytearray(chunk_size)
+    view = memoryview(buffer)
+    with open(src_path, "rb") as src, open(dst_path, "wb") as dst:
+        while True:
+            n = src.readinto(buffer)
+            if not n:
+                break
+            dst.write(stream.update(view[:n]))
+        dst.write(stream.finalize())
+
+def encrypt_file(src_path, dst_path, key, mode, iv=None, chunk_size=1 << 20):
+    _process_file(src_path, dst_path, XTEA.new(key, mode, iv), chunk_size)
+
+def decrypt_file(src_path, dst_path, key, mode, iv=None, chunk_size=1 << 20):
+    _process_file(src_path, dst_path, XTEA.new(key, mode, iv, decrypt=True), chunk_size)
+
+# ---------------- PARALLEL ----------------
+
+# Each plaintext block of CBC depends only on two ciphertext blocks and CTR
+# blocks only on their counter, so both split into independent segments
+
+def _process_segment(mode, key, input_name, output_name, start, end, state):
+    # Worker: process input[start:end] into output[start:end], both shared
+    # memory blocks; state is the previous ciphertext block (CBC) or the
+    # counter of the first block (CTR)
+    src = shared_memory.SharedMemory(name=input_name)
+    dst = shared_memory.SharedMemory(name=output_name)
+    try:
+        cipher = XTEA(key)
+        if mode == "CBC":
+            cipher._cbc_decrypt(src.buf[start:end], dst.buf, start, state)
+        else:
+            cipher._ctr_process(src.buf[start:end], dst.buf, start, state)
+    finally:
+        src.close()
+        dst.close()
+
+def _process_parallel(mode, data, key, iv, processes, segments_per_process):
+    size = len(data)
+    processes = processes or os.cpu_count() or 1
+    blocks = (size + 7) // 8
+    segment_size = 8 * max(-(-blocks // (processes * segments_per_process)), 1)
     counter = int.from_bytes(iv, "big")
-    out = b""
-    for i in range(0, len(data), 8):
-        block = counter.to_bytes(8, "big")
-        stream = xtea_encrypt_block(block, key)
-        chunk = data[i:i+8]
-        out += bytes(a ^ b for a, b in zip(chunk, stream[:len(chunk)]))
-        counter += 1
-    return out
+
+    src = shared_memory.SharedMemory(create=True, size=max(size, 1))
+    dst = shared_memory.SharedMemory(create=True, size=max(size, 1))
+    try:
+        src.buf[:size] = data
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            tasks = []
+            for start in range(0, size, segment_size):
+                if mode == "CBC":
+                    state = bytes(iv) if start == 0 else bytes(src.buf[start - 8:start])
+                else:
+                    state = counter + start // 8
+                tasks.append(executor.submit(_process_segment, mode, key, src.name, dst.name,
+                                             start, min(start + segment_size, size), state))
+            for task in tasks:
+                task.result()
+        return bytes(dst.buf[:size])
+    finally:
+        src.close()
+        src.unlink()
+        dst.close()
+        dst.unlink()
+
+def cbc_decrypt_parallel(ct, key, iv, processes=None, segments_per_process=4):
+    if processes == 1:
+        return cbc_decrypt(ct, key, iv)
+    if len(ct) % 8:
+        raise ValueError("data length must be a multiple of 8")
+    return unpad(_process_parallel("CBC", ct, key, iv, processes, segments_per_process))
+
+def ctr_process_parallel(data, key, iv, processes=None, segments_per_process=4):
+    if processes == 1:
+        return ctr_process(data, key, iv)
+    return _process_parallel("CTR", data, key, iv, processes, segments_per_process)
+
+# ---------------- BENCHMARK ----------------
+
+def benchmark_blocks(n=20000):
+    key = os.urandom(16)
+    data = os.urandom(8 * n)
+    cipher = XTEA(key)
+    out = bytearray(len(data))
+
+    start = time.perf_counter()
+    ref = b"".join(xtea_encrypt_block(data[i:i+8], key) for i in range(0, len(data), 8))
+    print(f"{'xtea_encrypt_block':<24}: {n / (time.perf_counter() - start):10.0f} blocs/s")
+
+    start = time.perf_counter()
+    cipher._encrypt_scalar(data, out, 0)
+    print(f"{'XTEA, bloc par bloc':<24}: {n / (time.perf_counter() - start):10.0f} blocs/s")
+
+    start = time.perf_counter()
+    ct = cipher.encrypt_blocks(data)
+    print(f"{'XTEA.encrypt_blocks':<24}: {n / (time.perf_counter() - start):10.0f} blocs/s")
+
+    start = time.perf_counter()
+    b"".join(xtea_decrypt_block(ct[i:i+8], key) for i in range(0, len(ct), 8))
+    print(f"{'xtea_decrypt_block':<24}: {n / (time.perf_counter() - start):10.0f} blocs/s")
+
+    start = time.perf_counter()
+    pt = cipher.decrypt_blocks(ct)
+    print(f"{'XTEA.decrypt_blocks':<24}: {n / (time.perf_counter() - start):10.0f} blocs/s")
+
+    assert bytes(out) == ct == ref and pt == data
+
+def self_test(n=1000):
+    # Lane engine and fast modes against the per-block reference functions
+    for count in (1, 2, LANE_MIN_BLOCKS, 100, LANE_BLOCKS + 3, n):
+        key = os.urandom(16)
+        data = os.urandom(8 * count)
+        cipher = XTEA(key)
+        ref = b"".join(xtea_encrypt_block(data[i:i+8], key) for i in range(0, len(data), 8))
+        if cipher.encrypt_blocks(data) != ref or cipher.decrypt_blocks(ref) != data:
+            return False
+
+        iv = os.urandom(8)
+        counter = int.from_bytes(iv, "big")
+        stream = b"".join(xtea_encrypt_block(((counter + i) & 0xffffffffffffffff).to_bytes(8, "big"), key)
+                          for i in range(count))
+        msg = data[:-3]
+        if ctr_process(msg, key, iv) != bytes(a ^ b for a, b in zip(msg, stream)):
+            return False
+        if ecb_decrypt(ecb_encrypt(msg, key), key) != msg:
+            return False
+    return True
+
+def benchmark_modes(size=1 << 20):
+    key = os.urandom(16)
+    iv = os.urandom(8)
+    data = os.urandom(size)
+    print(f"{size} octets")
+
+    start = time.perf_counter()
+    b"".join(xtea_encrypt_block(data[i:i+8], key) for i in range(0, size, 8))
+    print(f"{'ECB, bloc par bloc':<24}: {size / (time.perf_counter() - start) / 1e6:8.2f} Mo/s")
+
+    start = time.perf_counter()
+    ecb_encrypt(data, key)
+    print(f"{'ecb_encrypt':<24}: {size / (time.perf_counter() - start) / 1e6:8.2f} Mo/s")
+
+    ct = ecb_encrypt(data, key)
+    start = time.perf_counter()
+    ecb_decrypt(ct, key)
+    print(f"{'ecb_decrypt':<24}: {size / (time.perf_counter() - start) / 1e6:8.2f} Mo/s")
+
+    start = time.perf_counter()
+    ctr_process(data, key, iv)
+    print(f"{'ctr_process':<24}: {size / (time.perf_counter() - start) / 1e6:8.2f} Mo/s")
+
+def _benchmark_cbc_ciphertext(size, key, iv):
+    # Valid CBC ciphertext of size bytes (a multiple of 8) without encrypting
+    # block by block: random blocks, then a full padding block chained on them
+    ct = bytearray(os.urandom(size - 8))
+    prev = ct[-8:] if ct else iv
+    ct += XTEA(key).encrypt_block(bytes(b ^ 8 for b in prev))
+    return bytes(ct)
+
+def benchmark_scaling(sizes=(1 << 10, 1 << 15, 1 << 20, 1 << 25, 1 << 30), max_chain_size=1 << 22):
+    # Cost per byte for each mode; it stays flat when the time grows linearly.
+    # CBC encryption and OFB are sequential (block by block), so sizes above
+    # max_chain_size are skipped for them
+    key = os.urandom(16)
+    iv = os.urandom(8)
+    # The decrypt rows need valid padding, so they read a real ciphertext
+    modes = [
+        ("ECB enc", False, "plain", lambda src, dst: ecb_encrypt_into(src, key, dst)),
+        ("ECB dec", False, "ecb", lambda src, dst: ecb_decrypt_into(src, key, dst)),
+        ("CBC enc", True, "plain", lambda src, dst: cbc_encrypt_into(src, key, iv, dst)),
+        ("CBC dec", False, "cbc", lambda src, dst: cbc_decrypt_into(src, key, iv, dst)),
+        ("OFB", True, "plain", lambda src, dst: ofb_process_into(src, key, iv, dst)),
+        ("CTR", False, "plain", lambda src, dst: ctr_process_into(src, key, iv, dst)),
+    ]
+
+    print(f"{'Taille':>12} | " + " | ".join(f"{name:>9}" for name, _, _, _ in modes) + "   (ns/octet)")
+    print("-" * (15 + 12 * len(modes)))
+    for size in sizes:
+        data = os.urandom(size)
+        sources = {
+            "plain": data,
+            "ecb": ecb_encrypt(data, key),
+            "cbc": _benchmark_cbc_ciphertext(padded_size(size), key, iv),
+        }
+        out = bytearray(padded_size(size))
+        cells = []
+        for name, chained, source, process in modes:
+            if chained and size > max_chain_size:
+                cells.append(f"{'ignoré':>9}")
+                continue
+            start = time.perf_counter()
+            process(sources[source], out)
+            cells.append(f"{(time.perf_counter() - start) / size * 1e9:9.0f}")
+        print(f"{size:>12} | " + " | ".join(cells))
+
+def benchmark_parallel(size=1 << 27, max_processes=None):
+    max_processes = max_processes or os.cpu_count() or 1
+    key = os.urandom(16)
+    iv = os.urandom(8)
+    size = max(size - size % 8, 8)
+    # CBC decryption checks the padding, so it reads a valid ciphertext
+    inputs = (
+        ("CBC dec", cbc_decrypt_parallel, _benchmark_cbc_ciphertext(size, key, iv)),
+        ("CTR", ctr_process_parallel, os.urandom(size)),
+    )
+
+    for name, process, data in inputs:
+        print(f"\n{name}, {len(data) / 2**20:.0f} Mio")
+        print(f"{'Processus':>9} | {'Durée (s)':>10} | {'Mo/s':>8} | {'Accélération':>12}")
+        print("-" * 49)
+        reference = None
+        processes = 1
+        while True:
+            start = time.perf_counter()
+            process(data, key, iv, processes)
+            duration = time.perf_counter() - start
+            reference = reference or duration
+            print(f"{processes:>9} | {duration:10.2f} | {len(data) / duration / 1e6:8.1f} | {reference / duration:12.2f}")
+
+            if processes >= max_processes:
+                break
+            processes = min(processes * 2, max_processes)
 
 # ---------------- USER INTERFACE ----------------
 